@@ -0,0 +1 @@
+"""Benchmarks and development tools for the myUplink integration."""
@@ -0,0 +1,252 @@
+"""Local stand-in for the myUplink v2 API with rate limit emulation.
+
+Serve a generated account or a fixture, for example:
+
+    python -m benchmarks.fake_server --systems 10 --devices 2 --points 500
+    python -m benchmarks.fake_server --fixture account.json --latency 0.2
+
+Clients reach it with the base URL http://<host>:<port>/v2, see
+AsyncConfigEntryAuth.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import json
+from math import ceil
+from pathlib import Path
+import random
+from time import monotonic
+from typing import Any
+
+from aiohttp import web
+
+from .payloads import Account, AccountSize
+
+API_PREFIX = "/v2"
+
+
+@dataclass(slots=True)
+class ServerConfig:
+    """Behaviour of the fake API server."""
+
+    # Requests allowed per rate limit window
+    rate_limit: int = 25
+    # Length of the rate limit window in seconds
+    rate_limit_window: float = 60
+    # Mean response delay and its random deviation in seconds
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Share of requests answered with 500 Internal Server Error
+    error_rate: float = 0.0
+    seed: int = 0
+
+
+class RateLimitWindow:
+    """Fixed window rate limit as announced by the RateLimit-* headers."""
+
+    def __init__(self, limit: int, window: float) -> None:
+        """Initialize rate limit window."""
+        self.limit = limit
+        self.window = window
+        self.remaining = limit
+        self._reset_at = monotonic() + window
+
+    def acquire(self) -> tuple[bool, dict[str, str]]:
+        """Take a request from the window, return if allowed and the headers."""
+        now = monotonic()
+        if now >= self._reset_at:
+            self._reset_at = now + self.window
+            self.remaining = self.limit
+
+        allowed = self.remaining > 0
+        if allowed:
+            self.remaining -= 1
+
+        return allowed, {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(self.remaining),
+            "RateLimit-Reset": str(ceil(self._reset_at - now)),
+        }
+
+
+class FakeApiServer:
+    """Serve the myUplink endpoints used by the integration from an account."""
+
+    def __init__(self, account: Account, config: ServerConfig | None = None) -> None:
+        """Initialize server."""
+        self.account = account
+        self.config = config or ServerConfig()
+        self.rate_limit = RateLimitWindow(
+            self.config.rate_limit, self.config.rate_limit_window
+        )
+        self.requests = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self._random = random.Random(self.config.seed)
+
+    def create_app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        app.add_routes(
+            [
+                web.get(f"{API_PREFIX}/systems/me", self._get),
+                web.get(f"{API_PREFIX}/systems/{{system_id}}/subscriptions", self._get),
+                web.get(
+                    f"{API_PREFIX}/systems/{{system_id}}/notifications/active",
+                    self._get,
+                ),
+                web.get(
+                    f"{API_PREFIX}/systems/{{system_id}}/smart-home-mode", self._get
+                ),
+                web.put(
+                    f"{API_PREFIX}/systems/{{system_id}}/smart-home-mode",
+                    self._put_smart_home_mode,
+                ),
+                web.get(f"{API_PREFIX}/devices/{{device_id}}/points", self._get),
+                web.patch(
+                    f"{API_PREFIX}/devices/{{device_id}}/points", self._patch_points
+                ),
+                web.get(
+                    f"{API_PREFIX}/devices/{{device_id}}/smart-home-zones", self._get
+                ),
+                web.patch(
+                    f"{API_PREFIX}/devices/{{device_id}}/zones/{{zone_id}}",
+                    self._patch_zone,
+                ),
+                web.get(f"{API_PREFIX}/devices/{{device_id}}/firmware-info", self._get),
+            ]
+        )
+        return app
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: Any
+    ) -> web.StreamResponse:
+        """Apply authorization, rate limit, latency and error injection."""
+        self.requests += 1
+        if not request.headers.get("Authorization", "").startswith("Bearer "):
+            return web.json_response({"error": "unauthorized"}, status=401)
+
+        allowed, headers = self.rate_limit.acquire()
+        if not allowed:
+            self.rate_limited += 1
+            return web.json_response(
+                {"error": "rate limit exceeded"},
+                status=429,
+                headers={**headers, "Retry-After": headers["RateLimit-Reset"]},
+            )
+
+        delay = self.config.latency + self._random.uniform(
+            -self.config.jitter, self.config.jitter
+        )
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self._random.random() < self.config.error_rate:
+            self.errors += 1
+            return web.json_response(
+                {"error": "injected error"}, status=500, headers=headers
+            )
+
+        response = await handler(request)
+        response.headers.update(headers)
+        return response
+
+    async def _get(self, request: web.Request) -> web.Response:
+        """Return the payload of a GET request."""
+        payload = self.account.get(
+            request.path.removeprefix(API_PREFIX), dict(request.query)
+        )
+        if payload is None:
+            raise web.HTTPNotFound
+        return web.json_response(payload)
+
+    async def _patch_points(self, request: web.Request) -> web.Response:
+        """Set point values of a device."""
+        values = await request.json()
+        if not self.account.patch_points(request.match_info["device_id"], values):
+            raise web.HTTPBadRequest
+        return web.json_response(
+            [
+                {"parameterId": parameter_id, "value": value, "status": "modified"}
+                for parameter_id, value in values.items()
+            ]
+        )
+
+    async def _patch_zone(self, request: web.Request) -> web.Response:
+        """Set properties of a smart home zone."""
+        values = await request.json()
+        if not self.account.patch_zone(
+            request.match_info["device_id"], request.match_info["zone_id"], values
+        ):
+            raise web.HTTPNotFound
+        return web.json_response(values)
+
+    async def _put_smart_home_mode(self, request: web.Request) -> web.Response:
+        """Set the smart home mode of a system."""
+        data = await request.json()
+        if not self.account.put_smart_home_mode(
+            request.match_info["system_id"], data.get("smartHomeMode", "")
+        ):
+            raise web.HTTPNotFound
+        return web.json_response({"payload": {"state": "ok"}})
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the account and server options to parser."""
+    parser.add_argument("--fixture", type=Path, help="serve the account of a fixture")
+    parser.add_argument("--systems", type=int, default=1)
+    parser.add_argument("--devices", type=int, default=1)
+    parser.add_argument("--points", type=int, default=100)
+    parser.add_argument("--rate-limit", type=int, default=25)
+    parser.add_argument("--rate-limit-window", type=float, default=60)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def server_from_arguments(args: argparse.Namespace) -> FakeApiServer:
+    """Return a server for the parsed options of add_arguments."""
+    if args.fixture:
+        account = Account.from_fixture(json.loads(args.fixture.read_text()), args.seed)
+    else:
+        account = Account(
+            AccountSize(systems=args.systems, devices=args.devices, points=args.points),
+            args.seed,
+        )
+    return FakeApiServer(
+        account,
+        ServerConfig(
+            rate_limit=args.rate_limit,
+            rate_limit_window=args.rate_limit_window,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        ),
+    )
+
+
+def main() -> None:
+    """Run the fake API server from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--write-fixture", type=Path, help="write the served account as fixture"
+    )
+    args = parser.parse_args()
+
+    server = server_from_arguments(args)
+    if args.write_fixture:
+        args.write_fixture.write_text(json.dumps(server.account.as_fixture()))
+    web.run_app(server.create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
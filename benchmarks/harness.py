@@ -0,0 +1,139 @@
+"""Run the myUplink API client against in-process payloads."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+from time import time
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import ClientResponseError, RequestInfo
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.myuplink.api import (
+    AsyncConfigEntryAuth,
+    ConnectionStats,
+    MyUplink,
+)
+from custom_components.myuplink.const import API_HOST, API_VERSION, DOMAIN
+
+from .payloads import Account
+
+API_URL = f"{API_HOST}/{API_VERSION}/"
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp client response."""
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        status: int,
+        body: bytes,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize response."""
+        self.method = method
+        self.url = URL(url)
+        self.status = status
+        self.headers = CIMultiDictProxy(
+            CIMultiDict({"Content-Type": "application/json", **(headers or {})})
+        )
+        self.content_length = len(body)
+        self._body = body
+
+    async def read(self) -> bytes:
+        """Return the response body."""
+        return self._body
+
+    async def json(self) -> Any:
+        """Return the decoded response body."""
+        return json.loads(self._body)
+
+    def raise_for_status(self) -> None:
+        """Raise ClientResponseError for error status codes."""
+        if self.status >= 400:
+            raise ClientResponseError(
+                RequestInfo(self.url, self.method, CIMultiDictProxy(CIMultiDict())),
+                (),
+                status=self.status,
+            )
+
+    def release(self) -> None:
+        """Release the response (no-op)."""
+
+
+class FakeWebSession:
+    """Answer API requests from a synthetic account without any I/O.
+
+    Encoded response bodies are kept until clear is called, so repeated
+    polls measure the client and not the JSON encoding of the payloads.
+    """
+
+    def __init__(self, account: Account) -> None:
+        """Initialize session."""
+        self.account = account
+        self.requests = 0
+        self._bodies: dict[tuple, bytes | None] = {}
+
+    def clear(self) -> None:
+        """Forget encoded bodies after the account changed."""
+        self._bodies.clear()
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+        """Return the response of a request."""
+        self.requests += 1
+        path = url.removeprefix(API_URL)
+        params = kwargs.get("params") or {}
+
+        if method.lower() != "get":
+            return FakeResponse(method, url, 204, b"")
+
+        key = (path, tuple(sorted(params.items())))
+        if key not in self._bodies:
+            payload = self.account.get(path, params)
+            self._bodies[key] = (
+                None if payload is None else json.dumps(payload).encode()
+            )
+
+        body = self._bodies[key]
+        if body is None:
+            return FakeResponse(method, url, 404, b"{}")
+        return FakeResponse(method, url, 200, body)
+
+
+@dataclass
+class BenchConfigEntry:
+    """Config entry attributes read by the API client, coordinator and platforms."""
+
+    options: dict[str, Any] = field(default_factory=dict)
+    entry_id: str = "benchmark"
+    title: str = "Benchmark"
+    domain: str = DOMAIN
+    data: dict[str, Any] = field(default_factory=dict)
+    runtime_data: Any = None
+
+
+def create_api(
+    hass: HomeAssistant,
+    websession: Any,
+    entry: BenchConfigEntry,
+    base_url: str = API_URL,
+    connection_stats: ConnectionStats | None = None,
+) -> MyUplink:
+    """Return an API client using websession with a token that never expires."""
+    oauth_session = SimpleNamespace(
+        hass=hass,
+        token={"access_token": "benchmark", "expires_at": time() + 365 * 86400},
+    )
+    auth = AsyncConfigEntryAuth(websession, oauth_session, connection_stats, base_url)
+    api = MyUplink(auth, "en-US", entry)
+    # Polls are far apart in practice, so results must not be shared between
+    # the back-to-back polls of a benchmark.
+    api.single_flight.ttl = 0
+    return api
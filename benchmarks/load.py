@@ -0,0 +1,151 @@
+"""Load test the API client against the fake myUplink API server.
+
+Without --url an embedded server is started with the given account and
+server options, for example:
+
+    python -m benchmarks.load --systems 20 --devices 2 --cycles 5 --rate-limit 100
+    python -m benchmarks.load --url http://127.0.0.1:8080/v2 --cycles 10
+
+Cycles that return fewer systems than the account has fail, the command
+exits with status 1 if any cycle returned an incomplete list of systems.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import asdict, dataclass
+import json
+import sys
+import tempfile
+from time import perf_counter
+from typing import Any
+
+from aiohttp import ClientError, web
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.myuplink.api import ConnectionStats, create_websession
+
+from .fake_server import API_PREFIX, add_arguments, server_from_arguments
+from .harness import BenchConfigEntry, create_api
+
+
+@dataclass(slots=True)
+class LoadCycle:
+    """Result of one refresh cycle."""
+
+    duration: float
+    requests: int
+    rate_limited: int
+    throttle_wait: float
+    systems: int = 0
+    error: str | None = None
+
+
+async def async_load(args: argparse.Namespace) -> dict[str, Any]:
+    """Run refresh cycles against the server and return the results."""
+    runner: web.AppRunner | None = None
+    server = None
+    base_url = args.url
+    expected_systems = args.expect_systems
+    if base_url is None:
+        server = server_from_arguments(args)
+        expected_systems = len(server.account.systems)
+        runner = web.AppRunner(server.create_app())
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = runner.addresses[0][:2]
+        base_url = f"http://{host}:{port}{API_PREFIX}"
+
+    connection_stats = ConnectionStats()
+    websession = create_websession(connection_stats)
+    cycles: list[LoadCycle] = []
+    incomplete_cycles = 0
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(config_dir)
+            api = create_api(
+                hass, websession, BenchConfigEntry(), base_url, connection_stats
+            )
+            auth = api.auth
+            for _ in range(args.cycles):
+                requests = auth.request_count
+                rate_limited = auth.rate_limited_count
+                throttle_wait = auth.throttle_wait_seconds
+                error = None
+                systems = []
+                start = perf_counter()
+                try:
+                    systems = await api.get_systems()
+                except (ClientError, TimeoutError) as err:
+                    error = repr(err)
+                if (
+                    error is None
+                    and expected_systems is not None
+                    and len(systems) != expected_systems
+                ):
+                    error = f"Incomplete systems: {len(systems)} of {expected_systems}"
+                    incomplete_cycles += 1
+                cycles.append(
+                    LoadCycle(
+                        duration=perf_counter() - start,
+                        requests=auth.request_count - requests,
+                        rate_limited=auth.rate_limited_count - rate_limited,
+                        throttle_wait=auth.throttle_wait_seconds - throttle_wait,
+                        systems=len(systems),
+                        error=error,
+                    )
+                )
+                await asyncio.sleep(args.interval)
+    finally:
+        await websession.close()
+        if runner is not None:
+            await runner.cleanup()
+
+    return {
+        "base_url": base_url,
+        "cycles": [asdict(cycle) for cycle in cycles],
+        "failed_cycles": sum(cycle.error is not None for cycle in cycles),
+        "expected_systems": expected_systems,
+        "incomplete_cycles": incomplete_cycles,
+        "requests": auth.request_stats.as_dict(),
+        "connections": {
+            "created": connection_stats.created,
+            "reused": connection_stats.reused,
+        },
+        "server": None
+        if server is None
+        else {
+            "requests": server.requests,
+            "rate_limited": server.rate_limited,
+            "errors": server.errors,
+        },
+    }
+
+
+def main() -> None:
+    """Run the load test from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    parser.add_argument("--url", help="base URL of a running server")
+    parser.add_argument(
+        "--expect-systems",
+        type=int,
+        help="number of systems of the account at --url, checked every cycle",
+    )
+    parser.add_argument("--cycles", type=int, default=3)
+    parser.add_argument(
+        "--interval", type=float, default=0.0, help="seconds between cycles"
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(async_load(args))
+    json.dump(results, sys.stdout, indent=2)
+    if results["incomplete_cycles"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
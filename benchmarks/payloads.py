@@ -0,0 +1,398 @@
+"""Synthetic myUplink API payloads for benchmarks and local testing."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+import random
+from typing import Any
+import uuid
+
+# Product name of devices exposed as water heater entities
+WATER_HEATER_PRODUCT = "18760NE"
+
+FIRST_PARAMETER_ID = 40000
+NO_VALUE = -32768
+
+
+@dataclass(slots=True)
+class AccountSize:
+    """Size of a synthetic myUplink account."""
+
+    systems: int = 1
+    devices: int = 1
+    points: int = 100
+    zones: int = 2
+    notifications: int = 2
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the size as dictionary."""
+        return {
+            "systems": self.systems,
+            "devices": self.devices,
+            "points": self.points,
+            "zones": self.zones,
+            "notifications": self.notifications,
+        }
+
+
+def _timestamp(offset: int = 0) -> str:
+    """Return an API timestamp offset seconds from a fixed point in time."""
+    moment = datetime(2024, 1, 1, tzinfo=UTC) + timedelta(seconds=offset)
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+def _enum_values(*texts: str) -> list[dict[str, str]]:
+    """Return enum values for texts, numbered from zero."""
+    return [
+        {"value": str(index), "text": text, "icon": ""}
+        for index, text in enumerate(texts)
+    ]
+
+
+def _point(
+    parameter_id: int,
+    name: str,
+    value: Any,
+    *,
+    category: str = "Heat pump",
+    unit: str = "",
+    writable: bool = False,
+    min_value: int | None = None,
+    max_value: int | None = None,
+    step_value: int = 1,
+    enum_values: list[dict[str, str]] | None = None,
+    scale_value: str = "1",
+    str_val: str = "",
+) -> dict[str, Any]:
+    """Return a points payload item."""
+    return {
+        "category": category,
+        "parameterId": str(parameter_id),
+        "parameterName": name,
+        "parameterUnit": unit,
+        "writable": writable,
+        "timestamp": _timestamp(),
+        "value": value,
+        "strVal": str_val or str(value),
+        "smartHomeCategories": [],
+        "minValue": min_value,
+        "maxValue": max_value,
+        "stepValue": step_value,
+        "enumValues": enum_values or [],
+        "scaleValue": scale_value,
+        "zoneId": None,
+    }
+
+
+def _water_heater_points() -> list[dict[str, Any]]:
+    """Return the points read by the water heater entity."""
+    modes = _enum_values("Economy", "Normal", "Luxury")
+    return [
+        _point(406, "Operating mode", 1, enum_values=modes, str_val="Normal"),
+        _point(500, "Hot water mode", 1, writable=True, enum_values=modes),
+        _point(
+            516, "Hysteresis", 5, unit="°C", writable=True, min_value=1, max_value=15
+        ),
+        _point(
+            527,
+            "Target temperature",
+            55,
+            unit="°C",
+            writable=True,
+            min_value=2000,
+            max_value=7000,
+            scale_value="0.01",
+        ),
+        _point(528, "Hot water temperature", 51.2, unit="°C"),
+    ]
+
+
+class Account:
+    """A synthetic myUplink account answering API paths like the cloud API.
+
+    The same seed and size always produce the same payloads. Values of
+    points can be changed between polls with change_values.
+    """
+
+    def __init__(self, size: AccountSize, seed: int = 0) -> None:
+        """Initialize account."""
+        self.size = size
+        self._random = random.Random(seed)
+        self.systems: list[dict[str, Any]] = []
+        self.points: dict[str, list[dict[str, Any]]] = {}
+        self.zones: dict[str, list[dict[str, Any]]] = {}
+        self.notifications: dict[str, list[dict[str, Any]]] = {}
+        self.smart_home_modes: dict[str, str] = {}
+        self._build()
+
+    @classmethod
+    def from_fixture(cls, fixture: dict[str, Any], seed: int = 0) -> Account:
+        """Return an account with the state of a fixture written by as_fixture."""
+        account = cls(AccountSize(systems=0), seed)
+        account.systems = fixture["systems"]
+        account.points = fixture["points"]
+        account.zones = fixture["zones"]
+        account.notifications = fixture["notifications"]
+        account.smart_home_modes = fixture["smart_home_modes"]
+        return account
+
+    def as_fixture(self) -> dict[str, Any]:
+        """Return the state of the account as fixture."""
+        return {
+            "systems": self.systems,
+            "points": self.points,
+            "zones": self.zones,
+            "notifications": self.notifications,
+            "smart_home_modes": self.smart_home_modes,
+        }
+
+    def _uuid(self) -> str:
+        """Return a reproducible random UUID."""
+        return str(uuid.UUID(int=self._random.getrandbits(128), version=4))
+
+    def _build(self) -> None:
+        """Generate all systems and their devices."""
+        for system_index in range(self.size.systems):
+            system_id = self._uuid()
+            devices = []
+            for device_index in range(self.size.devices):
+                # The last device of every system is a water heater.
+                water_heater = device_index == self.size.devices - 1
+                device_id = f"bench-{system_index:03d}-{device_index}-{self._uuid()}"
+                devices.append(
+                    {
+                        "id": device_id,
+                        "connectionState": "Connected",
+                        "currentFwVersion": "9.0.0",
+                        "product": {
+                            "serialNumber": f"{system_index:05d}{device_index:03d}",
+                            "name": WATER_HEATER_PRODUCT
+                            if water_heater
+                            else "NIBE S1255",
+                        },
+                    }
+                )
+                self.points[device_id] = self._points(water_heater)
+                self.zones[device_id] = self._zones()
+
+            self.systems.append(
+                {
+                    "systemId": system_id,
+                    "name": f"Benchmark {system_index}",
+                    "securityLevel": "admin",
+                    "hasAlarm": False,
+                    "country": "Sweden",
+                    "devices": devices,
+                }
+            )
+            self.smart_home_modes[system_id] = "Default"
+            self.notifications[system_id] = [
+                {
+                    "id": self._uuid(),
+                    "alarmNumber": 180 + index,
+                    "deviceId": devices[index % len(devices)]["id"],
+                    "severity": 1,
+                    "status": "Active",
+                    "createdDatetime": _timestamp(index),
+                    "header": "Low hot water temperature",
+                    "description": "The hot water temperature is low.",
+                    "equipName": "EB101",
+                }
+                for index in range(self.size.notifications)
+            ]
+
+    def _points(self, water_heater: bool) -> list[dict[str, Any]]:
+        """Return the points of a device.
+
+        Points are a mix of read-only sensors, binary states, writable
+        numbers and writable enums in roughly the proportions of a heat pump.
+        """
+        points = _water_heater_points() if water_heater else []
+        for index in range(self.size.points - len(points)):
+            parameter_id = FIRST_PARAMETER_ID + index
+            kind = index % 20
+            name = f"Parameter {parameter_id}"
+            if kind < 12:
+                points.append(
+                    _point(
+                        parameter_id,
+                        name,
+                        round(self._random.uniform(-20, 60), 1),
+                        unit="°C",
+                    )
+                )
+            elif kind < 14:
+                points.append(
+                    _point(
+                        parameter_id,
+                        name,
+                        self._random.randint(0, 1),
+                        enum_values=_enum_values("Off", "On"),
+                    )
+                )
+            elif kind < 17:
+                points.append(
+                    _point(
+                        parameter_id,
+                        name,
+                        self._random.randint(0, 100),
+                        unit="%",
+                        writable=True,
+                        min_value=0,
+                        max_value=100,
+                    )
+                )
+            elif kind < 19:
+                points.append(
+                    _point(
+                        parameter_id,
+                        name,
+                        self._random.randint(0, 2),
+                        writable=True,
+                        enum_values=_enum_values("Auto", "Manual", "Add. heat only"),
+                    )
+                )
+            else:
+                points.append(_point(parameter_id, name, NO_VALUE, unit="kWh"))
+        return points
+
+    def _zones(self) -> list[dict[str, Any]]:
+        """Return the smart home zones of a device."""
+        return [
+            {
+                "zoneId": str(index),
+                "name": f"Zone {index}",
+                "commandOnly": index % 2 == 1,
+                "supportedModes": "heat",
+                "mode": "heat",
+                "temperature": 21.5,
+                "setpoint": 21,
+                "setpointHeat": 21,
+                "setpointCool": None,
+                "setpointRangeMin": 5,
+                "setpointRangeMax": 35,
+                "isCelsius": True,
+                "indoorCo2": 600,
+                "indoorHumidity": 40.5,
+            }
+            for index in range(self.size.zones)
+        ]
+
+    def change_values(self, count: int) -> None:
+        """Change the values of count random points."""
+        points = [point for device in self.points.values() for point in device]
+        for point in self._random.sample(points, min(count, len(points))):
+            if point["value"] == NO_VALUE:
+                continue
+            if isinstance(point["value"], float):
+                point["value"] = round(point["value"] + 0.1, 1)
+            elif point["enumValues"]:
+                point["value"] = (point["value"] + 1) % len(point["enumValues"])
+            else:
+                point["value"] += 1
+            point["strVal"] = str(point["value"])
+
+    def patch_points(self, device_id: str, values: dict[str, Any]) -> bool:
+        """Set point values of a device, return False for unknown points."""
+        points = {
+            point["parameterId"]: point for point in self.points.get(device_id, [])
+        }
+        if not values or any(parameter_id not in points for parameter_id in values):
+            return False
+        for parameter_id, value in values.items():
+            points[parameter_id]["value"] = value
+            points[parameter_id]["strVal"] = str(value)
+        return True
+
+    def patch_zone(self, device_id: str, zone_id: str, values: dict[str, Any]) -> bool:
+        """Set properties of a smart home zone, return False for unknown zones."""
+        for zone in self.zones.get(device_id, []):
+            if zone["zoneId"] == zone_id:
+                zone.update(values)
+                return True
+        return False
+
+    def put_smart_home_mode(self, system_id: str, mode: str) -> bool:
+        """Set the smart home mode of a system, return False for unknown systems."""
+        if system_id not in self.smart_home_modes:
+            return False
+        self.smart_home_modes[system_id] = mode
+        return True
+
+    def _page(
+        self, items: list[dict[str, Any]], key: str, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Return a page of a paginated resource."""
+        page = int(params.get("page", 1))
+        per_page = int(params.get("itemsPerPage", 10))
+        start = (page - 1) * per_page
+        return {
+            "page": page,
+            "itemsPerPage": per_page,
+            "numItems": len(items),
+            key: items[start : start + per_page],
+        }
+
+    def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Return the payload of a GET request or None for unknown paths."""
+        params = params or {}
+        parts = path.strip("/").split("/")
+
+        if parts == ["systems", "me"]:
+            return self._page(self.systems, "systems", params)
+
+        if parts[0] == "systems" and len(parts) >= 3:
+            system_id = parts[1]
+            if system_id not in self.smart_home_modes:
+                return None
+            if parts[2:] == ["subscriptions"]:
+                return {
+                    "subscriptions": [
+                        {"type": "manage", "validUntil": "2099-01-01T00:00:00+00:00"}
+                    ]
+                }
+            if parts[2:] == ["smart-home-mode"]:
+                return {"smartHomeMode": self.smart_home_modes[system_id]}
+            if parts[2:] == ["notifications", "active"]:
+                return self._page(
+                    self.notifications[system_id], "notifications", params
+                )
+            return None
+
+        if parts[0] == "devices" and len(parts) == 3:
+            device_id = parts[1]
+            if device_id not in self.points:
+                return None
+            if parts[2] == "points":
+                points = self.points[device_id]
+                if wanted := params.get("parameters"):
+                    ids = set(str(wanted).split(","))
+                    points = [point for point in points if point["parameterId"] in ids]
+                return points
+            if parts[2] == "smart-home-zones":
+                return self.zones[device_id]
+            if parts[2] == "firmware-info":
+                return {
+                    "deviceId": device_id,
+                    "firmwareId": 1,
+                    "currentFwVersion": "9.0.0",
+                    "pendingFwVersion": "",
+                    "desiredFwVersion": "9.0.0",
+                }
+        return None
+
+
+@dataclass(slots=True)
+class Scenario:
+    """A named account size to benchmark."""
+
+    name: str
+    size: AccountSize = field(default_factory=AccountSize)
+
+
+SCENARIOS = [
+    Scenario("small", AccountSize(systems=1, devices=1, points=100)),
+    Scenario("medium", AccountSize(systems=10, devices=2, points=500)),
+    Scenario("large", AccountSize(systems=100, devices=3, points=1000)),
+]
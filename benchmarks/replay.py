@@ -0,0 +1,207 @@
+"""Replay recorded myUplink API traffic through the client and coordinator.
+
+Recordings are written by the "Record API Traffic" option, for example:
+
+    python -m benchmarks.replay myuplink_recording.jsonl.gz
+    python -m benchmarks.replay myuplink_recording.jsonl.gz --speed 20
+
+Every recorded refresh cycle is replayed as one coordinator refresh. Without
+--speed the cycles run back to back and responses are returned at once.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import defaultdict, deque
+from collections.abc import Iterable
+from dataclasses import asdict
+import gzip
+import json
+from math import ceil
+from pathlib import Path
+import sys
+import tempfile
+from typing import Any
+
+from aiohttp import ClientConnectionError
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.myuplink.coordinator import MyUplinkDataUpdateCoordinator
+from custom_components.myuplink.recorder import DevicePseudonyms
+
+from .harness import API_URL, BenchConfigEntry, FakeResponse, create_api
+
+
+def load_recording(path: Path) -> list[dict[str, Any]]:
+    """Return the exchanges of a recording with device ids replaced.
+
+    Recordings already contain pseudonyms, replacing them again keeps the
+    device ids of older recordings consistent between paths and payloads.
+    """
+    pseudonyms = DevicePseudonyms()
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        exchanges = [json.loads(line) for line in file if line.strip()]
+    for exchange in exchanges:
+        exchange["path"], exchange["request"], exchange["body"] = pseudonyms.apply(
+            exchange["path"], exchange["request"], exchange["body"]
+        )
+    return exchanges
+
+
+def split_cycles(exchanges: Iterable[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Split exchanges into refresh cycles, each starting with systems/me."""
+    cycles: list[list[dict[str, Any]]] = []
+    for exchange in exchanges:
+        starts_cycle = (
+            exchange["method"] == "get"
+            and exchange["path"] == "systems/me"
+            and int(exchange["params"].get("page", 1)) == 1
+        )
+        if starts_cycle or not cycles:
+            cycles.append([])
+        cycles[-1].append(exchange)
+    return cycles
+
+
+def _key(method: str, path: str, params: dict[str, Any]) -> tuple:
+    """Return the key matching a request to recorded exchanges."""
+    return (
+        method.lower(),
+        path,
+        tuple(sorted((name, str(value)) for name, value in params.items())),
+    )
+
+
+class ReplaySession:
+    """Answer requests with recorded responses in their recorded order.
+
+    Requests without a recorded response left get the last response of the
+    same request again. Latencies and rate limit windows are shortened by
+    speed, a speed of 0 skips latencies and rate limit windows completely.
+    """
+
+    def __init__(self, exchanges: Iterable[dict[str, Any]], speed: float) -> None:
+        """Initialize session."""
+        self.speed = speed
+        self.missing = 0
+        self._responses: dict[tuple, deque[dict[str, Any]]] = defaultdict(deque)
+        self._last: dict[tuple, dict[str, Any]] = {}
+        for exchange in exchanges:
+            key = _key(exchange["method"], exchange["path"], exchange["params"])
+            self._responses[key].append(exchange)
+
+    def _headers(self, headers: dict[str, str]) -> dict[str, str]:
+        """Return recorded headers with the rate limit window shortened."""
+        headers = dict(headers)
+        if "RateLimit-Reset" in headers:
+            if self.speed:
+                reset = int(headers["RateLimit-Reset"]) / self.speed
+                headers["RateLimit-Reset"] = str(ceil(reset))
+            else:
+                del headers["RateLimit-Reset"]
+        return headers
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+        """Return the recorded response of a request."""
+        key = _key(method, url.removeprefix(API_URL), kwargs.get("params") or {})
+        if queue := self._responses.get(key):
+            self._last[key] = queue.popleft()
+        if (exchange := self._last.get(key)) is None:
+            self.missing += 1
+            return FakeResponse(method, url, 404, b"{}")
+
+        if self.speed:
+            await asyncio.sleep(exchange["latency"] / self.speed)
+        if exchange["status"] == "error":
+            raise ClientConnectionError("Recorded connection error")
+
+        body = exchange["body"]
+        if body is None:
+            data = b""
+        elif isinstance(body, str):
+            data = body.encode()
+        else:
+            data = json.dumps(body).encode()
+        return FakeResponse(
+            method, url, exchange["status"], data, self._headers(exchange["headers"])
+        )
+
+
+async def async_replay(args: argparse.Namespace) -> dict[str, Any]:
+    """Replay a recording and return the statistics of every cycle."""
+    exchanges = load_recording(args.recording)
+    cycles = split_cycles(exchanges)
+    if args.cycles:
+        cycles = cycles[: args.cycles]
+    options = json.loads(args.options.read_text()) if args.options else {}
+
+    session = ReplaySession(
+        [exchange for cycle in cycles for exchange in cycle], args.speed
+    )
+    entry = BenchConfigEntry(options=options)
+    results = []
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        api = create_api(hass, session, entry)
+        coordinator = MyUplinkDataUpdateCoordinator(hass, entry, api)
+        entry.runtime_data = coordinator
+
+        previous_start = None
+        for cycle in cycles:
+            start = cycle[0]["time"]
+            if args.speed and previous_start is not None:
+                await asyncio.sleep(max(start - previous_start, 0) / args.speed)
+            previous_start = start
+
+            changed_values = api.changed_values
+            await coordinator.async_refresh()
+            results.append(
+                {
+                    "recorded_requests": len(cycle),
+                    "success": coordinator.last_update_success,
+                    "changed_values": api.changed_values - changed_values,
+                    **asdict(coordinator.last_cycle),
+                }
+            )
+
+    return {
+        "recording": str(args.recording),
+        "speed": args.speed,
+        "cycles": results,
+        "missing_responses": session.missing,
+        "requests": api.auth.request_stats.as_dict(),
+        "responses": {
+            "not_modified": api.response_cache.not_modified,
+            "unchanged": api.response_cache.unchanged,
+            "decoded": api.response_cache.decoded,
+            "decode_seconds": api.response_cache.decode_seconds,
+        },
+    }
+
+
+def main() -> None:
+    """Replay a recording from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", type=Path)
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="replay speed relative to the recording, 0 replays at once",
+    )
+    parser.add_argument("--cycles", type=int, help="replay only the first cycles")
+    parser.add_argument(
+        "--options",
+        type=Path,
+        help="JSON file with the integration options used while recording",
+    )
+    args = parser.parse_args()
+
+    json.dump(asyncio.run(async_replay(args)), sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""Benchmark parsing, platform setup and entity dispatch of the integration.
+
+Run from the repository root, for example:
+
+    python -m benchmarks.run --output before.json
+    python -m benchmarks.run --systems 500 --devices 5 --points 2000
+    python -m benchmarks.run --output after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+import gc
+import importlib
+import json
+from pathlib import Path
+import platform
+import sys
+import tempfile
+from time import perf_counter
+import tracemalloc
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+
+from custom_components.myuplink.const import PLATFORMS
+from custom_components.myuplink.coordinator import MyUplinkDataUpdateCoordinator
+from custom_components.myuplink.entity import MyUplinkParameterEntity
+
+from .harness import BenchConfigEntry, FakeWebSession, create_api
+from .payloads import SCENARIOS, Account, AccountSize, Scenario
+
+MANIFEST = Path(__file__).parents[1] / "custom_components/myuplink/manifest.json"
+
+# Metrics compared between runs, lower is better
+COMPARED_METRICS = (
+    "parse_cold",
+    "parse_unchanged",
+    "parse_changed",
+    "setup_total",
+    "dispatch",
+    "dispatch_full",
+    "peak_memory_bytes",
+)
+
+
+class BestOf:
+    """Keep the shortest duration of repeated measurements."""
+
+    def __init__(self) -> None:
+        """Initialize measurement."""
+        self.seconds = float("inf")
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """Measure the enclosed block."""
+        gc.collect()
+        start = perf_counter()
+        yield
+        self.seconds = min(self.seconds, perf_counter() - start)
+
+
+def _bounded(low: int, high: int) -> Callable[[str], int]:
+    """Return an argparse type accepting integers between low and high."""
+
+    def parse(value: str) -> int:
+        number = int(value)
+        if not low <= number <= high:
+            raise argparse.ArgumentTypeError(f"must be between {low} and {high}")
+        return number
+
+    return parse
+
+
+async def _setup_platforms(
+    hass: HomeAssistant, entry: BenchConfigEntry, timers: dict[str, BestOf]
+) -> dict[str, list[Entity]]:
+    """Set up all platforms and return their entities."""
+    entities: dict[str, list[Entity]] = {}
+    for domain in PLATFORMS:
+        module = importlib.import_module(f"custom_components.myuplink.{domain}")
+        entities[domain] = added = []
+        with timers.setdefault(domain, BestOf()).measure():
+            await module.async_setup_entry(hass, entry, added.extend)
+    return entities
+
+
+async def run_scenario(
+    hass: HomeAssistant, scenario: Scenario, repeat: int, changes: int
+) -> dict[str, Any]:
+    """Return the results of a scenario."""
+    account = Account(scenario.size)
+    websession = FakeWebSession(account)
+    entry = BenchConfigEntry()
+
+    # Encode all response bodies once, outside the measurements.
+    await create_api(hass, websession, entry).get_systems()
+    requests_per_cycle = websession.requests
+
+    parse_cold = BestOf()
+    for _ in range(repeat):
+        api = create_api(hass, websession, entry)
+        with parse_cold.measure():
+            systems = await api.get_systems()
+
+    parse_unchanged = BestOf()
+    for _ in range(repeat):
+        with parse_unchanged.measure():
+            systems = await api.get_systems()
+
+    parse_changed = BestOf()
+    for _ in range(repeat):
+        account.change_values(changes)
+        websession.clear()
+        await create_api(hass, websession, entry).get_systems()
+        with parse_changed.measure():
+            systems = await api.get_systems()
+
+    coordinator = MyUplinkDataUpdateCoordinator(hass, entry, api)
+    coordinator.data = systems
+    entry.runtime_data = coordinator
+
+    setup: dict[str, BestOf] = {}
+    for _ in range(repeat):
+        entities = await _setup_platforms(hass, entry, setup)
+    all_entities = [entity for added in entities.values() for entity in added]
+
+    account.change_values(changes)
+    websession.clear()
+    coordinator.data = await api.get_systems()
+
+    # State writes are counted instead of performed, which limits the
+    # measurement to the work done by the integration itself.
+    state_writes = 0
+
+    def count_state_write(entity: Entity) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    dispatch = BestOf()
+    with patch.object(Entity, "async_write_ha_state", count_state_write):
+        for _ in range(repeat):
+            with dispatch.measure():
+                for entity in all_entities:
+                    entity._handle_coordinator_update()
+    dispatch_writes = state_writes
+
+    # Forgetting the metadata fingerprints makes every parameter entity
+    # apply its configuration again, as if all metadata changed.
+    parameter_entities = [
+        entity for entity in all_entities if isinstance(entity, MyUplinkParameterEntity)
+    ]
+    dispatch_full = BestOf()
+    with patch.object(Entity, "async_write_ha_state", count_state_write):
+        for _ in range(repeat):
+            for entity in parameter_entities:
+                entity._metadata_fingerprint = None
+            with dispatch_full.measure():
+                for entity in all_entities:
+                    entity._handle_coordinator_update()
+
+    entity_count = len(all_entities)
+    del api, systems, coordinator, entities, all_entities, parameter_entities
+    gc.collect()
+
+    # Memory is measured in a separate cycle, tracing slows everything down.
+    tracemalloc.start()
+    try:
+        memory_entry = BenchConfigEntry()
+        memory_api = create_api(hass, websession, memory_entry)
+        memory_coordinator = MyUplinkDataUpdateCoordinator(
+            hass, memory_entry, memory_api
+        )
+        memory_coordinator.data = await memory_api.get_systems()
+        memory_entry.runtime_data = memory_coordinator
+        entities = await _setup_platforms(hass, memory_entry, {})
+        retained_memory, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "size": scenario.size.as_dict(),
+        "requests_per_cycle": requests_per_cycle,
+        "entities": {str(domain): len(added) for domain, added in entities.items()},
+        "parse_cold": parse_cold.seconds,
+        "parse_unchanged": parse_unchanged.seconds,
+        "parse_changed": parse_changed.seconds,
+        "setup": {str(domain): timer.seconds for domain, timer in setup.items()},
+        "setup_total": sum(timer.seconds for timer in setup.values()),
+        "dispatch": dispatch.seconds,
+        "dispatch_full": dispatch_full.seconds,
+        "update_per_entity": dispatch.seconds / max(entity_count, 1),
+        "update_per_entity_full": dispatch_full.seconds / max(entity_count, 1),
+        "state_writes_per_dispatch": dispatch_writes // repeat,
+        "peak_memory_bytes": peak_memory,
+        "retained_memory_bytes": retained_memory,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], results: dict[str, Any], threshold: float
+) -> bool:
+    """Print the change of every metric and return if any regressed."""
+    regressed = False
+    for name, scenario in results["scenarios"].items():
+        if (before := baseline["scenarios"].get(name)) is None:
+            continue
+        if before["size"] != scenario["size"]:
+            print(f"{name}: size differs from baseline, skipped")
+            continue
+        for metric in COMPARED_METRICS:
+            if metric not in before:
+                continue
+            old, new = before[metric], scenario[metric]
+            change = (new - old) / old if old else 0.0
+            marker = ""
+            if change > threshold:
+                marker = "  REGRESSION"
+                regressed = True
+            print(
+                f"{name:>10} {metric:<18} {old:>14.6g} {new:>14.6g}",
+                f"{change:>+8.1%}{marker}",
+            )
+    return regressed
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the selected scenarios and return the results."""
+    if args.systems or args.devices or args.points:
+        scenarios = [
+            Scenario(
+                "custom",
+                AccountSize(
+                    systems=args.systems or 1,
+                    devices=args.devices or 1,
+                    points=args.points or 100,
+                ),
+            )
+        ]
+    else:
+        scenarios = [
+            scenario
+            for scenario in SCENARIOS
+            if not args.scenario or scenario.name in args.scenario
+        ]
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        results: dict[str, Any] = {}
+        for scenario in scenarios:
+            print(f"Running {scenario.name} {scenario.size.as_dict()}", file=sys.stderr)
+            results[scenario.name] = await run_scenario(
+                hass, scenario, args.repeat, args.changes
+            )
+
+    return {
+        "version": json.loads(MANIFEST.read_text())["version"],
+        "python": platform.python_version(),
+        "created": datetime.now(UTC).isoformat(),
+        "repeat": args.repeat,
+        "changes": args.changes,
+        "scenarios": results,
+    }
+
+
+def main() -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="scenario to run, may be repeated (default: all)",
+    )
+    parser.add_argument("--systems", type=_bounded(1, 500), help="custom size: systems")
+    parser.add_argument(
+        "--devices", type=_bounded(1, 5), help="custom size: devices per system"
+    )
+    parser.add_argument(
+        "--points", type=_bounded(100, 2000), help="custom size: points per device"
+    )
+    parser.add_argument("--repeat", type=_bounded(1, 100), default=5)
+    parser.add_argument(
+        "--changes", type=int, default=50, help="values changed between polls"
+    )
+    parser.add_argument("--output", type=Path, help="write results as JSON to file")
+    parser.add_argument("--compare", type=Path, help="baseline results to compare")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative change reported as regression (default: 0.2)",
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(async_main(args))
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        return int(compare(baseline, results, args.threshold))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
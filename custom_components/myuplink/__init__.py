@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
-from datetime import timedelta
 from http import HTTPStatus
 import logging
 
@@ -11,16 +9,25 @@ import aiohttp
 import jwt
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers import aiohttp_client, config_entry_oauth2_flow
+from homeassistant.helpers import config_entry_oauth2_flow
 from homeassistant.helpers.device_registry import DeviceEntry
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import AsyncConfigEntryAuth, MyUplink
-from .const import DEFAULT_SCAN_INTERVAL, PLATFORMS, SCOPES
+from .api import AsyncConfigEntryAuth, ConnectionStats, MyUplink, create_websession
+from .const import (
+    CONF_ENABLE_TRACING,
+    CONF_RECORD_TRAFFIC,
+    PLATFORMS,
+    RECORDING_FILENAME,
+    SCOPES,
+    TRACE_FILENAME,
+)
+from .coordinator import MyUplinkDataUpdateCoordinator
+from .recorder import TrafficRecorder
 from .services import async_setup_services, async_unload_services
+from .tracing import Tracer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,7 +41,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     session = config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation)
-    auth = AsyncConfigEntryAuth(aiohttp_client.async_get_clientsession(hass), session)
+
+    connection_stats = ConnectionStats()
+    websession = create_websession(connection_stats)
+
+    async def async_close_websession(event: Event | None = None) -> None:
+        await websession.close()
+
+    entry.async_on_unload(async_close_websession)
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close_websession)
+    )
+
+    auth = AsyncConfigEntryAuth(websession, session, connection_stats)
+    if entry.options.get(CONF_RECORD_TRAFFIC, False):
+        recorder = TrafficRecorder(hass.config.path(RECORDING_FILENAME))
+        auth.recorder = recorder
+
+        async def async_write_recording() -> None:
+            await hass.async_add_executor_job(recorder.write, recorder.pop_lines())
+
+        entry.async_on_unload(async_write_recording)
 
     try:
         await auth.async_get_access_token()
@@ -50,29 +77,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryAuthFailed
 
     api = MyUplink(auth, f"{hass.config.language}-{hass.config.country}", entry)
+    if entry.options.get(CONF_ENABLE_TRACING, False):
+        api.tracer = Tracer(hass.config.path(TRACE_FILENAME))
 
-    async def async_update_data():
-        try:
-            async with asyncio.timeout(30):
-                return await api.get_systems()
-        except aiohttp.ClientResponseError as err:
-            raise UpdateFailed(f"Wrong credentials: {err}") from err
-        except aiohttp.ClientConnectorError as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
-
-    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    _LOGGER.debug(
-        "Initialize coordinator with %d seconds update interval", scan_interval
-    )
+        async def async_close_tracer() -> None:
+            await hass.async_add_executor_job(api.tracer.close)
 
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="myUplink",
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=scan_interval),
-    )
+        entry.async_on_unload(async_close_tracer)
+
+    coordinator = MyUplinkDataUpdateCoordinator(hass, entry, api)
     await coordinator.async_config_entry_first_refresh()
+    coordinator.async_setup_device_index()
 
     entry.runtime_data = coordinator
 
@@ -4,13 +4,30 @@
 from __future__ import annotations
 
 import asyncio
-from contextlib import suppress
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
+import hashlib
 import json
 import logging
+import re
+from time import monotonic, perf_counter, time
+from types import MappingProxyType
 from typing import Any
 
-from aiohttp import ClientResponse, ClientResponseError, ClientSession
+from aiohttp import (
+    ClientError,
+    ClientResponse,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    TraceConfig,
+)
+from aiohttp.hdrs import USER_AGENT
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -22,8 +39,11 @@ from homeassistant.const import (
     UnitOfTime,
 )
 from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import client_context
 
 from .const import (
+    ACCEPTED_WRITE_STATUSES,
     API_HOST,
     API_VERSION,
     CONF_ADDITIONAL_PARAMETER,
@@ -31,38 +51,304 @@ from .const import (
     CONF_ENABLE_SMART_HOME_ZONE,
     CONF_FETCH_FIRMWARE,
     CONF_FETCH_NOTIFICATIONS,
+    CONF_MIN_STATE_INTERVAL,
     CONF_PARAMETER_WHITELIST,
     CONF_PLATFORM_OVERRIDE,
+    CONF_STATE_DEADBANDS,
     CONF_WRITABLE_OVERRIDE,
     CONF_WRITABLE_WITHOUT_SUBSCRIPTION,
+    CONF_WRITE_DEBOUNCE,
+    CONNECT_TIMEOUT,
+    CONNECTION_LIMIT_PER_HOST,
     DEFAULT_PLATFORM_OVERRIDE,
     DEFAULT_WRITABLE_OVERRIDE,
+    DEFAULT_WRITE_DEBOUNCE,
+    DNS_CACHE_TTL,
+    KEEPALIVE_TIMEOUT,
+    PENDING_WRITE_TTL,
+    REQUEST_TIMEOUT,
+    SINGLE_FLIGHT_RESULT_TTL,
+    WATER_HEATER_PARAMETERS,
+    WATER_HEATERS,
 )
+from .recorder import TrafficRecorder
+from .state_filter import StateWriteFilter
+from .tracing import Tracer
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class ConnectionStats:
+    """Count new and reused connections of the myUplink client session."""
+
+    def __init__(self) -> None:
+        """Initialize connection stats."""
+        self.created = 0
+        self.reused = 0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+
+    @property
+    def reuse_ratio(self) -> float | None:
+        """Return the share of requests served by an existing connection."""
+        total = self.created + self.reused
+        if total == 0:
+            return None
+        return self.reused / total
+
+    @property
+    def dns_cache_hit_ratio(self) -> float | None:
+        """Return the share of host lookups answered by the DNS cache."""
+        total = self.dns_cache_hits + self.dns_cache_misses
+        if total == 0:
+            return None
+        return self.dns_cache_hits / total
+
+    def trace_config(self) -> TraceConfig:
+        """Return a trace config recording connection statistics."""
+        trace_config = TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        return trace_config
+
+    async def _on_connection_create_end(self, session, context, params) -> None:
+        self.created += 1
+
+    async def _on_connection_reuseconn(self, session, context, params) -> None:
+        self.reused += 1
+
+    async def _on_dns_cache_hit(self, session, context, params) -> None:
+        self.dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(self, session, context, params) -> None:
+        self.dns_cache_misses += 1
+
+
+def create_websession(connection_stats: ConnectionStats) -> ClientSession:
+    """Return a client session dedicated to the myUplink API.
+
+    The session keeps its own connection pool instead of competing with
+    other integrations for the connector limits of the shared session, with
+    the SSL context and User-Agent of Home Assistant's sessions.
+    async_create_clientsession always uses the shared connector, so the
+    session is closed by the config entry instead.
+    """
+    connector = TCPConnector(
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        ssl=client_context(),
+    )
+    return ClientSession(
+        connector=connector,
+        timeout=ClientTimeout(total=REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+        headers={USER_AGENT: SERVER_SOFTWARE},
+        trace_configs=[connection_stats.trace_config()],
+    )
+
+
+# Upper bounds in seconds of the request latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_ID_SEGMENT = re.compile(r"\b(systems|devices|zones)/(?!me\b)[^/?]+")
+
+
+class EndpointStats:
+    """Latency, status code and payload statistics of a single endpoint."""
+
+    __slots__ = (
+        "count",
+        "decode_seconds",
+        "decodes",
+        "latency_buckets",
+        "latency_max",
+        "latency_sum",
+        "response_bytes",
+        "status_codes",
+    )
+
+    def __init__(self) -> None:
+        """Initialize endpoint stats."""
+        self.count = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        # One bucket per upper bound plus one for slower requests
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.status_codes: dict[str, int] = {}
+        self.response_bytes = 0
+        self.decodes = 0
+        self.decode_seconds = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as dictionary."""
+        return {
+            "count": self.count,
+            "latency_avg": self.latency_sum / self.count if self.count else None,
+            "latency_max": self.latency_max,
+            "latency_histogram": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(
+                        LATENCY_BUCKETS, self.latency_buckets, strict=False
+                    )
+                },
+                "inf": self.latency_buckets[-1],
+            },
+            "status_codes": dict(self.status_codes),
+            "response_bytes": self.response_bytes,
+            "decodes": self.decodes,
+            "decode_seconds": self.decode_seconds,
+        }
+
+
+class RequestStats:
+    """Collect statistics per endpoint template, e.g. `GET devices/{id}/points`.
+
+    The number of tracked endpoints is bounded, further endpoints are
+    collected as `other`.
+    """
+
+    MAX_ENDPOINTS = 32
+
+    def __init__(self) -> None:
+        """Initialize request stats."""
+        self.endpoints: dict[str, EndpointStats] = {}
+
+    @staticmethod
+    def endpoint(method: str, path: str) -> str:
+        """Return the endpoint template of a request."""
+        template = _ID_SEGMENT.sub(r"\1/{id}", path.split("?")[0])
+        return f"{method.upper()} {template}"
+
+    def _get(self, method: str, path: str) -> EndpointStats:
+        """Return the stats of the endpoint of a request."""
+        endpoint = self.endpoint(method, path)
+        if (stats := self.endpoints.get(endpoint)) is None:
+            if len(self.endpoints) >= self.MAX_ENDPOINTS:
+                endpoint = "other"
+            stats = self.endpoints.setdefault(endpoint, EndpointStats())
+        return stats
+
+    def record_request(
+        self, method: str, path: str, status: int | str, latency: float
+    ) -> None:
+        """Record latency and status of a request."""
+        stats = self._get(method, path)
+        stats.count += 1
+        stats.latency_sum += latency
+        stats.latency_max = max(stats.latency_max, latency)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                break
+        else:
+            index = len(LATENCY_BUCKETS)
+        stats.latency_buckets[index] += 1
+        stats.status_codes[str(status)] = stats.status_codes.get(str(status), 0) + 1
+
+    def record_response(
+        self, method: str, path: str, size: int, decode_seconds: float | None = None
+    ) -> None:
+        """Record payload size and decode time of a response."""
+        stats = self._get(method, path)
+        stats.response_bytes += size
+        if decode_seconds is not None:
+            stats.decodes += 1
+            stats.decode_seconds += decode_seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics of all endpoints as dictionary."""
+        return {endpoint: stats.as_dict() for endpoint, stats in self.endpoints.items()}
+
+
 class AsyncConfigEntryAuth:
     """Provide myUplink authentication tied to an OAuth2 based config entry."""
 
+    # Tokens expiring within this many seconds are refreshed before use.
+    TOKEN_EXPIRY_MARGIN = 20
+    # Tokens expiring within this many seconds are refreshed in the background
+    # while the current token is still handed out.
+    TOKEN_REFRESH_AHEAD = 300
+
     def __init__(
         self,
         websession: ClientSession,
         oauth_session: config_entry_oauth2_flow.OAuth2Session,
+        connection_stats: ConnectionStats | None = None,
+        base_url: str = f"{API_HOST}/{API_VERSION}",
     ) -> None:
         """Initialize myUplink auth."""
         self._websession = websession
+        self.base_url = base_url.rstrip("/")
         self._oauth_session = oauth_session
+        self.connection_stats = connection_stats or ConnectionStats()
+        self.request_stats = RequestStats()
+        # Records the API traffic if set
+        self.recorder: TrafficRecorder | None = None
+        self._token_refresh: asyncio.Task | None = None
         self.rate_limit_limit: int | None = None
         self.rate_limit_remaining: int | None = None
         self.rate_limit_reset_at: datetime | None = None
+        self.request_count = 0
+        self.failed_count = 0
+        self.rate_limited_count = 0
+        self.throttle_wait_seconds = 0.0
 
     async def async_get_access_token(self) -> str:
-        """Return a valid access token."""
-        await self._oauth_session.async_ensure_token_valid()
+        """Return a valid access token.
+
+        The token expiry is read from the cached token, so no refresh is made
+        while it is valid. Shortly before the expiry a refresh is started in
+        the background. Concurrent callers share a single running refresh.
+        """
+        token = self._oauth_session.token
+        expires_in = token.get("expires_at", 0) - time()
+
+        if expires_in > self.TOKEN_EXPIRY_MARGIN:
+            if expires_in < self.TOKEN_REFRESH_AHEAD:
+                self._async_start_token_refresh()
+            return token["access_token"]
+
+        await asyncio.shield(self._async_start_token_refresh())
 
         return self._oauth_session.token["access_token"]
 
+    def _async_start_token_refresh(self) -> asyncio.Task:
+        """Return the running token refresh or start a new one."""
+        if self._token_refresh is None:
+            self._token_refresh = self._oauth_session.hass.async_create_task(
+                self._async_refresh_token(), "myUplink token refresh"
+            )
+            self._token_refresh.add_done_callback(self._token_refresh_done)
+        return self._token_refresh
+
+    def _token_refresh_done(self, task: asyncio.Task) -> None:
+        """Release the finished token refresh."""
+        self._token_refresh = None
+        if not task.cancelled() and (err := task.exception()) is not None:
+            _LOGGER.debug("Token refresh failed: %s", err)
+
+    async def _async_refresh_token(self) -> None:
+        """Refresh the token and store it in the config entry."""
+        _LOGGER.debug("Refresh access token")
+        session = self._oauth_session
+        start = perf_counter()
+        try:
+            new_token = await session.implementation.async_refresh_token(session.token)
+        except ClientResponseError as err:
+            self.request_stats.record_request(
+                "post", "oauth/token", err.status, perf_counter() - start
+            )
+            raise
+        self.request_stats.record_request(
+            "post", "oauth/token", 200, perf_counter() - start
+        )
+        session.hass.config_entries.async_update_entry(
+            session.config_entry,
+            data={**session.config_entry.data, "token": new_token},
+        )
+
     def _update_rate_limit_headers(self, response: ClientResponse) -> None:
         """Extract and update rate limit headers from response.
 
@@ -110,18 +396,55 @@ class AsyncConfigEntryAuth:
         access_token = await self.async_get_access_token()
         headers["authorization"] = f"Bearer {access_token}"
 
-        url = f"{API_HOST}/{API_VERSION}/{path}"
+        url = f"{self.base_url}/{path}"
 
-        response = await self._websession.request(
-            method,
-            url,
-            **kwargs,
-            headers=headers,
-        )
+        start = perf_counter()
+        try:
+            response = await self._websession.request(
+                method,
+                url,
+                **kwargs,
+                headers=headers,
+            )
+        except (ClientError, TimeoutError):
+            latency = perf_counter() - start
+            self.request_stats.record_request(method, path, "error", latency)
+            if self.recorder is not None:
+                self.recorder.record(
+                    method,
+                    path,
+                    kwargs.get("params"),
+                    kwargs.get("data"),
+                    "error",
+                    None,
+                    None,
+                    latency,
+                )
+            raise
+        latency = perf_counter() - start
+        self.request_stats.record_request(method, path, response.status, latency)
+        if self.recorder is not None:
+            self.recorder.record(
+                method,
+                path,
+                kwargs.get("params"),
+                kwargs.get("data"),
+                response.status,
+                response.headers,
+                await response.read(),
+                latency,
+            )
+        if method.lower() != "get" and response.content_length is not None:
+            self.request_stats.record_response(method, path, response.content_length)
 
         self._update_rate_limit_headers(response)
 
+        self.request_count += 1
+        if response.status >= 400:
+            self.failed_count += 1
+
         if response.status == 429:
+            self.rate_limited_count += 1
             if self.rate_limit_reset_at:
                 wait_time = (self.rate_limit_reset_at - datetime.now()).total_seconds()
                 if wait_time > 0:
@@ -132,6 +455,7 @@ class AsyncConfigEntryAuth:
                         path,
                     )
                     await asyncio.sleep(wait_time + 0.1)
+                    self.throttle_wait_seconds += wait_time + 0.1
                     return response
 
         return response
@@ -247,9 +571,39 @@ class FirmwareInfo:
         return self.raw_data["desiredFwVersion"].strip()
 
 
+@dataclass(frozen=True, slots=True)
+class EnumMap:
+    """Options of an enum parameter, shared by all parameters with equal options."""
+
+    options: tuple[str, ...]
+    value_to_text: MappingProxyType[str, str]
+    text_to_value: MappingProxyType[str, str]
+
+    def text(self, value: float | str | None) -> str | None:
+        """Return the option text of a parameter value."""
+        if value is None:
+            return None
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return self.value_to_text.get(str(value))
+
+
+@lru_cache(maxsize=1024)
+def intern_enum_map(enums: tuple[tuple[str, str], ...]) -> EnumMap:
+    """Return the interned enum map of (value, text) pairs."""
+    return EnumMap(
+        options=tuple(text for _, text in enums),
+        value_to_text=MappingProxyType(dict(enums)),
+        text_to_value=MappingProxyType({text: value for value, text in enums}),
+    )
+
+
 class Parameter:
     """Class that represents a parameter object in the myUplink API."""
 
+    # Monotonic time of the last read of only this parameter
+    fetched_at: float = 0.0
+
     def __init__(self, raw_data: dict, device: Device) -> None:
         """Initialize a parameter object."""
         self.raw_data = raw_data
@@ -333,6 +687,41 @@ class Parameter:
         """Return the enum values of the parameter."""
         return self.raw_data["enumValues"]
 
+    @cached_property
+    def enum_map(self) -> EnumMap:
+        """Return the enum options of the parameter."""
+        return intern_enum_map(
+            tuple((enum["value"], enum["text"]) for enum in self.enum_values)
+        )
+
+    @cached_property
+    def metadata_fingerprint(self) -> tuple:
+        """Return the data entities are configured from, without the value."""
+        raw_data = self.raw_data
+        return (
+            raw_data["category"],
+            raw_data["parameterName"],
+            raw_data["parameterUnit"],
+            raw_data["writable"],
+            raw_data["minValue"],
+            raw_data["maxValue"],
+            raw_data.get("stepValue"),
+            raw_data["scaleValue"],
+            raw_data.get("zoneId"),
+            self.enum_map,
+        )
+
+    @property
+    def enum_text(self) -> str:
+        """Return the option text of the value.
+
+        The string value is not always in sync with the value, the option of
+        the value is used if the string value is not one of the options.
+        """
+        if self.string_value in self.enum_map.text_to_value:
+            return self.string_value
+        return self.enum_map.text(self.value) or self.string_value
+
     @property
     def scale_value(self) -> float:
         """Return the scale value of the parameter."""
@@ -346,13 +735,60 @@ class Parameter:
         """Return the zone id of the parameter."""
         return self.raw_data["zoneId"]
 
-    async def update_parameter(self, value) -> None:
-        """Set parameter value if writable."""
+    def validate_value(self, value: Any) -> Any:
+        """Return the value as written to the API, raise ValueError if invalid.
+
+        Enum parameters accept the value or the text of an option, other
+        parameters a number within the scaled range and step.
+        """
+        if not self.is_writable:
+            raise ValueError(f"parameter {self.id} is not writable")
+
+        if self.enum_values:
+            if self.enum_map.text(value) is not None:
+                option = value
+            elif (option := self.enum_map.text_to_value.get(str(value))) is None:
+                raise ValueError(f"{value} is not an option of parameter {self.id}")
+            number = float(option)
+            return int(number) if number.is_integer() else number
+
+        try:
+            number = float(value)
+        except (TypeError, ValueError) as err:
+            raise ValueError(f"{value} is not a number") from err
+
+        scale = self.scale_value
+        if self.min_value is not None and number < self.min_value * scale:
+            raise ValueError(f"{value} is below the minimum of parameter {self.id}")
+        if self.max_value is not None and number > self.max_value * scale:
+            raise ValueError(f"{value} is above the maximum of parameter {self.id}")
+        if self.min_value is not None and self.step_value:
+            steps = (number - self.min_value * scale) / (self.step_value * scale)
+            if abs(steps - round(steps)) > 1e-6:
+                raise ValueError(f"{value} is not a valid step of parameter {self.id}")
+
+        return number
+
+    async def update_parameter(self, value, debounce: bool = False) -> None:
+        """Set parameter value if writable.
+
+        Debounced writes are delayed until the value did not change for the
+        configured quiet period.
+        """
         if not self.is_writable:
             return
-        await self.device.system.api.patch_parameter(
-            self.device.id, str(self.id), value
-        )
+        api = self.device.system.api
+        requested = perf_counter()
+
+        async def write() -> None:
+            await api.patch_parameter(
+                self.device.id, str(self.id), value, requested=requested
+            )
+
+        if debounce:
+            await api.write_debouncer.write((self.device.id, self.id), write)
+        else:
+            await write()
 
     def get_platform(self) -> Platform:
         """Try to identify entity platform."""
@@ -515,14 +951,31 @@ class Zone:
             else None
         )
 
-    async def update_zone_property(self, property_name: str, value) -> None:
-        """Patch zone if writable."""
+    async def update_zone_property(
+        self, property_name: str, value, debounce: bool = False
+    ) -> None:
+        """Patch zone if writable.
+
+        Debounced writes are delayed until the value did not change for the
+        configured quiet period.
+        """
         if self.is_command_only:
             return
-        await self.device.system.api.patch_zone_property(
-            self.device.id, str(self.id), property_name, value
-        )
-        self.raw_data[property_name] = value
+        api = self.device.system.api
+        requested = perf_counter()
+
+        async def write() -> None:
+            await api.patch_zone_property(
+                self.device.id, str(self.id), property_name, value, requested
+            )
+            self.raw_data[property_name] = value
+
+        if debounce:
+            await api.write_debouncer.write(
+                (self.device.id, "zone", self.id, property_name), write
+            )
+        else:
+            await write()
 
 
 class Device:
@@ -537,9 +990,15 @@ class Device:
     # List of collected parameters
     parameters: list[Parameter] = []
 
+    # Collected parameters by id
+    parameter_index: dict[int, Parameter] = {}
+
     # List of collected zones
     zones: list[Zone] = []
 
+    # Monotonic time the parameters were last fetched
+    parameters_fetched_at: float = 0.0
+
     def __init__(self, raw_data: dict, system: System) -> None:
         """Initialize a device object."""
         self.raw_data = raw_data
@@ -557,6 +1016,11 @@ class Device:
             list(dict.fromkeys([self.raw_data["product"]["name"], self.system.name]))
         )
 
+    @property
+    def is_water_heater(self) -> bool:
+        """Return if the device is a water heater."""
+        return self.name[:7] in WATER_HEATERS
+
     @property
     def connection_state(self) -> str:
         """Return the connection_state of the device."""
@@ -583,11 +1047,13 @@ class Device:
 
     async def async_fetch_data(self) -> None:
         """Fetch data from myUplink API."""
-        self.parameters = await self.system.api.get_parameters(self)
-        if self.system.api.entry.options.get(CONF_FETCH_FIRMWARE, True):
-            self.firmware_info = await self.system.api.get_firmware_info(self)
-        if self.system.api.entry.options.get(CONF_ENABLE_SMART_HOME_ZONE, True):
-            self.zones = await self.system.api.get_zones(self)
+        with self.system.api.tracer.span("device", device=self.id):
+            self.parameters = await self.system.api.get_parameters(self)
+            self.parameters_fetched_at = monotonic()
+            if self.system.api.entry.options.get(CONF_FETCH_FIRMWARE, True):
+                self.firmware_info = await self.system.api.get_firmware_info(self)
+            if self.system.api.entry.options.get(CONF_ENABLE_SMART_HOME_ZONE, True):
+                self.zones = await self.system.api.get_zones(self)
 
 
 class System:
@@ -628,6 +1094,11 @@ class System:
 
     async def async_fetch_data(self) -> None:
         """Fetch data from myUplink API."""
+        with self.api.tracer.span("system", system=self.id):
+            await self._async_fetch_data()
+
+    async def _async_fetch_data(self) -> None:
+        """Fetch system and device data from myUplink API."""
         if not self.devices:
             self.devices = [
                 Device(device_data, self) for device_data in self.raw_data["devices"]
@@ -653,7 +1124,9 @@ class System:
 
     async def update_smart_home_mode(self, value) -> None:
         """Put smart home mode for system."""
-        await self.api.put_smart_home_mode(self.id, str(value))
+        await self.api.put_smart_home_mode(
+            self.id, str(value), requested=perf_counter()
+        )
 
 
 class Throttle:
@@ -691,6 +1164,7 @@ class Throttle:
                         int(wait_seconds),
                     )
                     await asyncio.sleep(wait_seconds + 0.1)
+                    self._auth.throttle_wait_seconds += wait_seconds + 0.1
                     return self
 
         # Only pace requests when the rate-limit window is running low.
@@ -708,6 +1182,7 @@ class Throttle:
                     delay,
                 )
                 await asyncio.sleep(delay)
+                self._auth.throttle_wait_seconds += delay
 
         return self
 
@@ -716,20 +1191,437 @@ class Throttle:
         self._last_request_time = datetime.now()
 
 
+class SingleFlight:
+    """Share in-flight requests and their parsed results between callers.
+
+    Concurrent calls with the same key wait for one running request instead
+    of starting their own. Results can optionally be reused for a short time
+    after the request finished. A request is cancelled once all of its
+    callers were cancelled, so abandoned requests do not use the rate limit.
+    """
+
+    def __init__(self, ttl: float = 0) -> None:
+        """Initialize single flight."""
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self._waiters: dict[asyncio.Task, int] = {}
+        self._results: dict[Hashable, tuple[float, Any]] = {}
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """Return the share of calls served without a request of their own."""
+        total = self.hits + self.misses
+        if total == 0:
+            return None
+        return self.hits / total
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the result for key, starting a request only if necessary."""
+        if key in self._results:
+            finished_at, result = self._results[key]
+            if monotonic() - finished_at < self.ttl:
+                self.hits += 1
+                return result
+            del self._results[key]
+
+        if (task := self._in_flight.get(key)) is not None:
+            self.hits += 1
+            return await self._wait(task)
+
+        self.misses += 1
+        task = asyncio.ensure_future(factory())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return await self._wait(task)
+
+    async def _wait(self, task: asyncio.Task) -> Any:
+        """Wait for a shared request, cancelling it with its last caller."""
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # Shielded so a cancelled caller does not cancel the others.
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():
+                    task.cancel()
+
+    def invalidate(self, match: Callable[[Hashable], bool]) -> None:
+        """Forget cached results and detach in-flight requests matching a key.
+
+        Detached requests still complete for their current waiters, but new
+        callers start a fresh request.
+        """
+        for key in [key for key in self._in_flight if match(key)]:
+            del self._in_flight[key]
+        for key in [key for key in self._results if match(key)]:
+            del self._results[key]
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Store the result of a finished request."""
+        # Requests invalidated while running are no longer registered and
+        # must not be cached.
+        current = self._in_flight.get(key) is task
+        if current:
+            del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if current and self.ttl > 0:
+            self._results[key] = (monotonic(), task.result())
+
+
+class RequestSlot:
+    """Grant the API to one request at a time, writes ahead of reads.
+
+    Poll cycles reserve the slot for every single request, so a write only
+    waits for the request in progress and not for the rest of the cycle.
+    """
+
+    def __init__(self) -> None:
+        """Initialize request slot."""
+        self._locked = False
+        self._writes: deque[asyncio.Future] = deque()
+        self._reads: deque[asyncio.Future] = deque()
+
+    @property
+    def queued_writes(self) -> int:
+        """Return the number of writes waiting for the slot."""
+        return len(self._writes)
+
+    @property
+    def queued_reads(self) -> int:
+        """Return the number of reads waiting for the slot."""
+        return len(self._reads)
+
+    def locked(self) -> bool:
+        """Return if a request holds the slot."""
+        return self._locked
+
+    async def acquire(self, priority: bool = False) -> None:
+        """Wait for the slot, priority requests are served first."""
+        if not self._locked:
+            self._locked = True
+            return
+
+        queue = self._writes if priority else self._reads
+        future = asyncio.get_running_loop().create_future()
+        queue.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over right before the cancellation.
+                self.release()
+            else:
+                queue.remove(future)
+            raise
+
+    def release(self) -> None:
+        """Hand the slot over to the next waiting request."""
+        for queue in (self._writes, self._reads):
+            while queue:
+                future = queue.popleft()
+                if not future.done():
+                    future.set_result(None)
+                    return
+        self._locked = False
+
+    @asynccontextmanager
+    async def reserve(self, priority: bool = False) -> AsyncIterator[None]:
+        """Hold the slot for the enclosed request."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+@dataclass(slots=True)
+class WriteLatency:
+    """Time from requesting a write until it is sent to the API.
+
+    Writes are requested by the entity or service call, so the quiet period
+    of debounced writes and the wait for the request slot are included.
+    """
+
+    count: int = 0
+    total: float = 0.0
+    last: float | None = None
+    max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record the latency of a write."""
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        self.max = max(self.max, seconds)
+
+
+class WriteDebouncer:
+    """Collapse rapid writes of the same key into a single write.
+
+    A write is sent once no newer value arrived for the quiet period. Callers
+    of superseded writes wait for the final write and share its result.
+    """
+
+    def __init__(self, delay: float) -> None:
+        """Initialize write debouncer."""
+        self.delay = delay
+        self.collapsed = 0
+        self._writes: dict[Hashable, Callable[[], Awaitable[Any]]] = {}
+        self._deadlines: dict[Hashable, float] = {}
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+
+    async def write(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Write the value of factory after the quiet period, last write wins."""
+        if self.delay <= 0:
+            return await factory()
+
+        self._writes[key] = factory
+        self._deadlines[key] = monotonic() + self.delay
+        if (task := self._tasks.get(key)) is not None:
+            self.collapsed += 1
+        else:
+            task = self._tasks[key] = asyncio.ensure_future(self._write(key))
+        return await asyncio.shield(task)
+
+    async def _write(self, key: Hashable) -> Any:
+        """Wait for the quiet period of key and run its latest write."""
+        while (remaining := self._deadlines[key] - monotonic()) > 0:
+            await asyncio.sleep(remaining)
+
+        # Writes arriving from now on start a new quiet period.
+        factory = self._writes.pop(key)
+        del self._deadlines[key]
+        del self._tasks[key]
+        return await factory()
+
+
+@dataclass(slots=True)
+class PendingWrite:
+    """A written parameter value not yet returned by the API."""
+
+    value: float
+    written_at: float
+
+
+class PendingWrites:
+    """Overlay written parameter values on poll results until confirmed.
+
+    The cloud often returns the previous value for a while after a write.
+    Until a poll returns the written value or the write expires, the
+    written value is shown instead.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """Initialize pending writes."""
+        self.ttl = ttl
+        self.confirmed = 0
+        self.expired = 0
+        self.confirmation_seconds = 0.0
+        self.last_confirmation_seconds: float | None = None
+        self.max_confirmation_seconds = 0.0
+        self._writes: dict[str, dict[str, PendingWrite]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of pending writes."""
+        return sum(len(writes) for writes in self._writes.values())
+
+    def add(self, device_id: str, parameter_id: str, value: Any) -> None:
+        """Add a successfully written value.
+
+        Values are sent as numbers or strings, but polled as numbers. Values
+        that are no number are not overlaid.
+        """
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            _LOGGER.debug(
+                "Not overlaying value %s of parameter %s", value, parameter_id
+            )
+            return
+        self._writes.setdefault(device_id, {})[str(parameter_id)] = PendingWrite(
+            number, monotonic()
+        )
+
+    def has_pending(self, device_id: str) -> bool:
+        """Return if a device has pending writes."""
+        return bool(self._writes.get(device_id))
+
+    def apply(self, device_id: str, parameter_data: dict) -> dict:
+        """Return the parameter data with a pending value applied.
+
+        The option text of enum parameters is applied with the value. The
+        returned dictionary is a copy if a value was applied, the decoded
+        response is shared with the response cache.
+        """
+        writes = self._writes.get(device_id)
+        if not writes:
+            return parameter_data
+        parameter_id = str(parameter_data["parameterId"])
+        if (pending := writes.get(parameter_id)) is None:
+            return parameter_data
+
+        elapsed = monotonic() - pending.written_at
+        polled = parameter_data["value"]
+        if isinstance(polled, int | float) and float(polled) == pending.value:
+            del writes[parameter_id]
+            self.confirmed += 1
+            self.confirmation_seconds += elapsed
+            self.last_confirmation_seconds = elapsed
+            self.max_confirmation_seconds = max(self.max_confirmation_seconds, elapsed)
+            return parameter_data
+        if elapsed > self.ttl:
+            del writes[parameter_id]
+            self.expired += 1
+            _LOGGER.debug(
+                "Value %s of parameter %s not confirmed within %d seconds",
+                pending.value,
+                parameter_id,
+                self.ttl,
+            )
+            return parameter_data
+
+        value = int(pending.value) if pending.value.is_integer() else pending.value
+        if enum_values := parameter_data.get("enumValues"):
+            text = intern_enum_map(
+                tuple((enum["value"], enum["text"]) for enum in enum_values)
+            ).text(value)
+            if text is not None:
+                return {**parameter_data, "value": value, "strVal": text}
+        return {**parameter_data, "value": value}
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """Validators, payload hash and decoded data of a previous GET response."""
+
+    digest: bytes
+    data: Any
+    decode_seconds: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class ResponseCache:
+    """Skip decoding GET responses that did not change since the last poll.
+
+    Conditional request headers are sent where the API returned ETag or
+    Last-Modified validators. Otherwise the raw payload is hashed and the
+    previously decoded data is reused if the hash matches.
+    """
+
+    def __init__(self) -> None:
+        """Initialize response cache."""
+        self.not_modified = 0
+        self.unchanged = 0
+        self.decoded = 0
+        self.decode_seconds = 0.0
+        self.decode_seconds_saved = 0.0
+        self._entries: dict[Hashable, CachedResponse] = {}
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """Return the share of responses served without decoding."""
+        hits = self.not_modified + self.unchanged
+        total = hits + self.decoded
+        if total == 0:
+            return None
+        return hits / total
+
+    def get(self, key: Hashable) -> CachedResponse | None:
+        """Return the cached response for key."""
+        return self._entries.get(key)
+
+    def conditional_headers(self, key: Hashable) -> dict[str, str]:
+        """Return conditional request headers for key."""
+        headers = {}
+        if (cached := self._entries.get(key)) is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def not_modified_data(self, key: Hashable) -> Any:
+        """Return the cached data for a 304 Not Modified response."""
+        cached = self._entries[key]
+        self.not_modified += 1
+        self.decode_seconds_saved += cached.decode_seconds
+        return cached.data
+
+    def decode(self, key: Hashable, resp: ClientResponse, body: bytes) -> Any:
+        """Return decoded data for body, reusing the cache if it is unchanged."""
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+
+        cached = self._entries.get(key)
+        if cached is not None and cached.digest == digest:
+            self.unchanged += 1
+            self.decode_seconds_saved += cached.decode_seconds
+            cached.etag = etag
+            cached.last_modified = last_modified
+            return cached.data
+
+        start = perf_counter()
+        data = json.loads(body)
+        decode_seconds = perf_counter() - start
+        self.decoded += 1
+        self.decode_seconds += decode_seconds
+
+        self._entries[key] = CachedResponse(
+            digest, data, decode_seconds, etag, last_modified
+        )
+        return data
+
+    def invalidate(self, match: Callable[[Hashable], bool]) -> None:
+        """Forget cached responses matching a key."""
+        for key in [key for key in self._entries if match(key)]:
+            del self._entries[key]
+
+
 class MyUplink:
     """Class to communicate with the myUplink API."""
 
     # List of collected systems
     systems: list[System] = []
 
+    # Page size for paginated resources (maximum accepted by the API)
+    ITEMS_PER_PAGE = 99
+
+    # Pages read at most, in case the API ignores the page of a request
+    MAX_PAGES = 100
+
     def __init__(
         self, auth: AsyncConfigEntryAuth, language_code: str, entry: ConfigEntry
     ) -> None:
         """Initialize the API and store the auth so we can make requests."""
         self.auth = auth
         self.entry = entry
-        self.lock = asyncio.Lock()
+        self.slot = RequestSlot()
+        self.write_latency = WriteLatency()
         self.throttle = Throttle(auth)
+        self.single_flight = SingleFlight(SINGLE_FLIGHT_RESULT_TTL)
+        self.response_cache = ResponseCache()
+        self.tracer = Tracer()
+        self.pending_writes = PendingWrites(PENDING_WRITE_TTL)
+        self.write_debouncer = WriteDebouncer(
+            entry.options.get(CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE)
+        )
+        self.state_filter = StateWriteFilter.from_options(
+            entry.options.get(CONF_STATE_DEADBANDS, "{}"),
+            entry.options.get(CONF_MIN_STATE_INTERVAL, 0),
+        )
+        self._parameter_cache: dict[
+            str, tuple[list[Any], list[Parameter], dict[int, Parameter]]
+        ] = {}
+        self._parameter_values: dict[tuple[str, Any], Any] = {}
+        # Number of parameter values that changed between two polls
+        self.changed_values = 0
 
         self.header = {"Accept-Language": language_code}
 
@@ -771,54 +1663,172 @@ class MyUplink:
         except json.decoder.JSONDecodeError:
             self.writable_override = DEFAULT_WRITABLE_OVERRIDE
 
+    async def _get_json(
+        self,
+        path: str,
+        headers: dict | None = None,
+        params: dict | None = None,
+        cache: bool = True,
+    ) -> Any:
+        """Return the decoded response of a GET request.
+
+        Identical requests running at the same time share one API call.
+        Unchanged responses return the previously decoded object. Requests
+        without cache are always sent and their response is not kept, for
+        on demand reads with changing parameters.
+        """
+        key = (
+            path,
+            tuple(sorted((params or {}).items())),
+            tuple(sorted((headers or {}).items())),
+        )
+
+        async def fetch() -> Any:
+            tracer = self.tracer
+            with tracer.span("request", endpoint=RequestStats.endpoint("get", path)):
+                request_headers = {
+                    **(headers or {}),
+                    **(self.response_cache.conditional_headers(key) if cache else {}),
+                }
+                wait_start = time()
+                async with self.slot.reserve(), self.throttle:
+                    tracer.record("wait", wait_start, time())
+                    with tracer.span("network"):
+                        resp = await self.auth.request(
+                            "get", path, headers=request_headers, params=params
+                        )
+                if resp.status == 304 and self.response_cache.get(key) is not None:
+                    self.auth.request_stats.record_response("get", path, 0)
+                    return self.response_cache.not_modified_data(key)
+                resp.raise_for_status()
+                with tracer.span("read"):
+                    body = await resp.read()
+                start = perf_counter()
+                with tracer.span("decode", bytes=len(body)):
+                    if cache:
+                        data = self.response_cache.decode(key, resp, body)
+                    else:
+                        data = json.loads(body)
+                self.auth.request_stats.record_response(
+                    "get", path, len(body), perf_counter() - start
+                )
+                return data
+
+        if not cache:
+            return await fetch()
+        return await self.single_flight.run(key, fetch)
+
+    async def _write(
+        self, method: str, path: str, data: dict, requested: float | None = None
+    ) -> ClientResponse:
+        """Send a write request ahead of the queued poll requests.
+
+        The write latency is measured from requested, a perf_counter value,
+        or else from now.
+        """
+        if requested is None:
+            requested = perf_counter()
+        async with self.slot.reserve(priority=True), self.throttle:
+            self.write_latency.record(perf_counter() - requested)
+            resp = await self.auth.request(
+                method,
+                path,
+                data=json.dumps(data),
+                headers={"Content-Type": "application/json-patch+json"},
+            )
+            # Read the body in the slot, so the connection is free for the
+            # next request.
+            await resp.read()
+            return resp
+
+    def _invalidate(self, path: str) -> None:
+        """Invalidate shared and cached GET results for a path after writing to it."""
+
+        def match(key: Hashable) -> bool:
+            return key[0] == path
+
+        self.single_flight.invalidate(match)
+        self.response_cache.invalidate(match)
+
+    async def iter_pages(
+        self, path: str, key: str, headers: dict | None = None
+    ) -> AsyncIterator[list[dict]]:
+        """Yield the items of a paginated resource page by page.
+
+        Each page is yielded as soon as it arrives, so callers can start
+        working on it while the next page is still being requested.
+        """
+        for page in range(1, self.MAX_PAGES + 1):
+            data = await self._get_json(
+                path,
+                headers=headers,
+                params={"page": page, "itemsPerPage": self.ITEMS_PER_PAGE},
+            )
+
+            items = data.get(key, [])
+            if items:
+                yield items
+
+            total = data.get("numItems")
+            if len(items) < self.ITEMS_PER_PAGE or (
+                total is not None and page * self.ITEMS_PER_PAGE >= total
+            ):
+                return
+        _LOGGER.warning(
+            "Stopped reading %s after %d pages of %d items",
+            path,
+            self.MAX_PAGES,
+            self.ITEMS_PER_PAGE,
+        )
+
     async def get_systems(self) -> list[System]:
         """Return all systems."""
         _LOGGER.debug("Fetch systems")
-        async with self.lock, self.throttle:
-            resp = await self.auth.request("get", "systems/me?page=1&itemsPerPage=99")
-        resp.raise_for_status()
-        data = await resp.json()
+        systems: list[System] = []
+        tasks: list[asyncio.Task] = []
 
-        self.systems = [System(system_data, self) for system_data in data["systems"]]
-
-        _LOGGER.debug("Update systems")
-        for system in self.systems:
-            await system.async_fetch_data()
+        try:
+            async for page in self.iter_pages("systems/me", "systems"):
+                _LOGGER.debug("Update %d systems", len(page))
+                for system_data in page:
+                    system = System(system_data, self)
+                    systems.append(system)
+                    tasks.append(asyncio.create_task(system.async_fetch_data()))
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        self.systems = systems
 
         return self.systems
 
     async def get_notifications(self, system: System) -> list[Notification]:
         """Return all active notifications by system id."""
         _LOGGER.debug("Fetch notifications for system %s", system.id)
-        async with self.lock, self.throttle:
-            resp = await self.auth.request(
-                "get",
-                f"systems/{system.id}/notifications/active?page=1&itemsPerPage=99",
+        return [
+            Notification(notification)
+            async for page in self.iter_pages(
+                f"systems/{system.id}/notifications/active",
+                "notifications",
                 headers=self.header,
             )
-        resp.raise_for_status()
-        data = await resp.json()
-
-        return [Notification(notification) for notification in data["notifications"]]
+            for notification in page
+        ]
 
     async def get_premium_manage(self, system: System) -> bool:
         """Check for a premium subscription to allow writing values."""
         _LOGGER.debug("Fetch subscriptions for system %s", system.id)
 
         try:
-            async with self.lock, self.throttle:
-                resp = await self.auth.request(
-                    "get", f"systems/{system.id}/subscriptions"
-                )
-
             # This will raise an exception for 4xx or 5xx errors
-            resp.raise_for_status()
+            data = await self._get_json(f"systems/{system.id}/subscriptions")
 
-            if resp.status == 200:
-                data = await resp.json()
-                for subscription in data.get("subscriptions", []):
-                    if Subscription(subscription).type == "manage":
-                        return True
+            for subscription in data.get("subscriptions", []):
+                if Subscription(subscription).type == "manage":
+                    return True
 
         except ClientResponseError as err:
             # We catch the 500 error (and others) here so the integration keeps running
@@ -831,29 +1841,26 @@ class MyUplink:
     async def get_smart_home_mode(self, system: System) -> str:
         """Return smart home mode by system id."""
         _LOGGER.debug("Fetch smart home mode for system %s", system.id)
-        async with self.lock, self.throttle:
-            resp = await self.auth.request(
-                "get", f"systems/{system.id}/smart-home-mode"
-            )
-        resp.raise_for_status()
-        data = await resp.json()
+        data = await self._get_json(f"systems/{system.id}/smart-home-mode")
 
         return data["smartHomeMode"]
 
-    async def put_smart_home_mode(self, system_id, value: str) -> bool:
+    async def put_smart_home_mode(
+        self, system_id, value: str, requested: float | None = None
+    ) -> bool:
         """Set the smart home mode for a system."""
         _LOGGER.debug(
             "Put smart home mode for system %s with value %s",
             system_id,
             value,
         )
-        async with self.lock, self.throttle:
-            resp = await self.auth.request(
-                "put",
-                f"systems/{system_id}/smart-home-mode",
-                data=json.dumps({"smartHomeMode": value}),
-                headers={"Content-Type": "application/json-patch+json"},
-            )
+        resp = await self._write(
+            "put",
+            f"systems/{system_id}/smart-home-mode",
+            {"smartHomeMode": value},
+            requested,
+        )
+        self._invalidate(f"systems/{system_id}/smart-home-mode")
         resp.raise_for_status()
         if resp.status == 200:
             data = await resp.json()
@@ -868,20 +1875,16 @@ class MyUplink:
     async def get_device(self, device_id: str) -> Device:
         """Return a device by id."""
         _LOGGER.debug("Fetch device with id %s", device_id)
-        async with self.lock, self.throttle:
-            resp = await self.auth.request("get", f"devices/{device_id}")
-        resp.raise_for_status()
-        return Device(await resp.json(), self)
+        return Device(await self._get_json(f"devices/{device_id}"), self)
 
     async def get_firmware_info(self, device: Device) -> FirmwareInfo:
         """Return firmware info for a device."""
         _LOGGER.debug("Fetch firmware info for device %s", device.id)
-        async with self.lock, self.throttle:
-            resp = await self.auth.request(
-                "get", f"devices/{device.id}/firmware-info", headers=self.header
+        return FirmwareInfo(
+            await self._get_json(
+                f"devices/{device.id}/firmware-info", headers=self.header
             )
-        resp.raise_for_status()
-        return FirmwareInfo(await resp.json())
+        )
 
     async def get_parameters(self, device: Device) -> list[Parameter]:
         """Return parameters info for a device."""
@@ -894,11 +1897,14 @@ class MyUplink:
                 parameter_filters.append(self.additional_parameter)
         else:
             parameter_filters.append(
-                [*self.parameter_whitelist, *self.additional_parameter]
+                [
+                    *self.parameter_whitelist,
+                    *self.additional_parameter,
+                    *(WATER_HEATER_PARAMETERS if device.is_water_heater else []),
+                ]
             )
 
-        unique_parameters = {}
-        seen = set()
+        responses = []
 
         for parameter_filter in parameter_filters:
             query_parameters = {}
@@ -907,16 +1913,45 @@ class MyUplink:
                     str(parameter_id) for parameter_id in parameter_filter
                 )
 
-            async with self.lock, self.throttle:
-                resp = await self.auth.request(
-                    "get",
+            responses.append(
+                await self._get_json(
                     f"devices/{device.id}/points",
                     headers=self.header,
                     params=query_parameters,
                 )
-            resp.raise_for_status()
-            parameters_data = await resp.json()
+            )
+
+        # Unchanged responses are returned as the identical decoded objects,
+        # so the parameters built from them last time can be reused.
+        cached_responses, cached_parameters, index = self._parameter_cache.get(
+            device.id, ([], [], {})
+        )
+        # Parameters built with pending writes applied are not reused, the
+        # writes may have expired since.
+        if len(cached_responses) == len(responses) and all(
+            cached is response
+            for cached, response in zip(cached_responses, responses, strict=True)
+        ):
+            for parameter in cached_parameters:
+                parameter.device = device
+            device.parameter_index = index
+            return cached_parameters
+
+        with self.tracer.span("reconcile", device=device.id):
+            return self._reconcile_parameters(device, responses)
+
+    def _reconcile_parameters(
+        self, device: Device, responses: list[Any]
+    ) -> list[Parameter]:
+        """Build the parameters of a device from the decoded points responses.
+
+        The parameter index of the device is rebuilt with them.
+        """
+        unique_parameters = {}
+        seen = set()
+        has_pending_writes = self.pending_writes.has_pending(device.id)
 
+        for parameters_data in responses:
             for parameter_data in parameters_data:
                 unique_key = (
                     parameter_data["parameterId"],
@@ -925,21 +1960,104 @@ class MyUplink:
 
                 if unique_key not in seen:
                     seen.add(unique_key)
+                    if has_pending_writes:
+                        parameter_data = self.pending_writes.apply(
+                            device.id, parameter_data
+                        )
                     unique_parameters[unique_key] = Parameter(parameter_data, device)
 
-        return list(unique_parameters.values())
+        for (parameter_id, _), parameter in unique_parameters.items():
+            key = (device.id, parameter_id)
+            value = parameter.raw_data["value"]
+            if key in self._parameter_values and self._parameter_values[key] != value:
+                self.changed_values += 1
+            self._parameter_values[key] = value
+
+        parameters = list(unique_parameters.values())
+        index = {parameter.id: parameter for parameter in parameters}
+        device.parameter_index = index
+        if has_pending_writes:
+            self._parameter_cache.pop(device.id, None)
+        else:
+            self._parameter_cache[device.id] = (responses, parameters, index)
+
+        return parameters
+
+    async def get_parameter_values(
+        self, device: Device, parameter_ids: list[str], max_age: float
+    ) -> list[Parameter]:
+        """Return parameters of a device read no longer than max_age ago.
+
+        Parameters not fetched within max_age seconds are requested with one
+        filtered points request and replace the polled parameters. The
+        request bypasses the shared and cached responses, which could be
+        older than max_age and would keep one entry per parameter selection.
+        """
+        oldest = monotonic() - max_age
+        parameters = {str(parameter.id): parameter for parameter in device.parameters}
+        positions = {
+            str(parameter.id): position
+            for position, parameter in enumerate(device.parameters)
+        }
+        stale = [
+            parameter_id
+            for parameter_id in parameter_ids
+            if parameter_id not in parameters
+            or device.parameters_fetched_at < oldest
+            and parameters[parameter_id].fetched_at < oldest
+        ]
+
+        if stale:
+            _LOGGER.debug("Read parameters %s for device %s", stale, device.id)
+            data = await self._get_json(
+                f"devices/{device.id}/points",
+                headers=self.header,
+                params={"parameters": ",".join(stale)},
+                cache=False,
+            )
+            fetched_at = monotonic()
+            has_pending_writes = self.pending_writes.has_pending(device.id)
+            updated = set()
+            for parameter_data in data:
+                parameter_id = str(parameter_data["parameterId"])
+                if parameter_id in updated:
+                    continue
+                updated.add(parameter_id)
+                if has_pending_writes:
+                    parameter_data = self.pending_writes.apply(
+                        device.id, parameter_data
+                    )
+                parameter = parameters[parameter_id] = Parameter(parameter_data, device)
+                parameter.fetched_at = fetched_at
+                if (position := positions.get(parameter_id)) is not None:
+                    device.parameters[position] = parameter
+                    device.parameter_index[parameter.id] = parameter
+            # The polled parameters no longer match the cached responses.
+            self._parameter_cache.pop(device.id, None)
+
+        return [
+            parameters[parameter_id]
+            for parameter_id in parameter_ids
+            if parameter_id in parameters
+        ]
 
     async def get_zones(self, device: Device) -> list[Zone]:
         """Return all smart home zones for a device."""
         _LOGGER.debug("Fetch zones for device %s", device.id)
-        async with self.lock, self.throttle:
-            resp = await self.auth.request(
-                "get", f"devices/{device.id}/smart-home-zones", headers=self.header
+        return [
+            Zone(zone, device)
+            for zone in await self._get_json(
+                f"devices/{device.id}/smart-home-zones", headers=self.header
             )
-        resp.raise_for_status()
-        return [Zone(zone, device) for zone in await resp.json()]
+        ]
 
-    async def patch_parameter(self, device_id, parameter_id: str, value: Any) -> bool:
+    async def patch_parameter(
+        self,
+        device_id,
+        parameter_id: str,
+        value: Any,
+        requested: float | None = None,
+    ) -> bool:
         """Update the value of a parameter for a device."""
         _LOGGER.debug(
             "Patch parameter %s for device %s with value %s",
@@ -947,18 +2065,63 @@ class MyUplink:
             device_id,
             value,
         )
-        async with self.lock, self.throttle:
-            resp = await self.auth.request(
-                "patch",
-                f"devices/{device_id}/points",
-                data=json.dumps({parameter_id: value}),
-                headers={"Content-Type": "application/json-patch+json"},
-            )
+        resp = await self._write(
+            "patch", f"devices/{device_id}/points", {parameter_id: value}, requested
+        )
+        self._invalidate(f"devices/{device_id}/points")
         resp.raise_for_status()
+        self.pending_writes.add(device_id, parameter_id, value)
         return resp.status == 200
 
+    async def patch_parameters(
+        self, device_id, values: dict[str, Any], requested: float | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Update the values of several parameters of a device with one request.
+
+        Return the written value and the status reported by the API for
+        every parameter. Values rejected by the API are not shown as pending.
+        """
+        _LOGGER.debug("Patch parameters %s for device %s", values, device_id)
+        resp = await self._write(
+            "patch", f"devices/{device_id}/points", values, requested
+        )
+        self._invalidate(f"devices/{device_id}/points")
+        resp.raise_for_status()
+
+        statuses: dict[str, str] = {}
+        if resp.status == 200:
+            with suppress(ClientError, ValueError):
+                data = await resp.json()
+                if isinstance(data, list):
+                    statuses = {
+                        str(item["parameterId"]): item.get("status", "")
+                        for item in data
+                        if isinstance(item, dict) and "parameterId" in item
+                    }
+
+        results = {}
+        for parameter_id, value in values.items():
+            status = statuses.get(parameter_id, "sent")
+            if status in ACCEPTED_WRITE_STATUSES:
+                self.pending_writes.add(device_id, parameter_id, value)
+            else:
+                _LOGGER.warning(
+                    "Parameter %s of device %s rejected value %s with status %s",
+                    parameter_id,
+                    device_id,
+                    value,
+                    status,
+                )
+            results[parameter_id] = {"value": value, "status": status}
+        return results
+
     async def patch_zone_property(
-        self, device_id, zone_id: str, property_name: str, value: str
+        self,
+        device_id,
+        zone_id: str,
+        property_name: str,
+        value: str,
+        requested: float | None = None,
     ) -> bool:
         """Update the value of a zone property for a device."""
         _LOGGER.debug(
@@ -968,13 +2131,13 @@ class MyUplink:
             device_id,
             value,
         )
-        async with self.lock, self.throttle:
-            resp = await self.auth.request(
-                "patch",
-                f"devices/{device_id}/zones/{zone_id}",
-                data=json.dumps({property_name: value}),
-                headers={"Content-Type": "application/json-patch+json"},
-            )
+        resp = await self._write(
+            "patch",
+            f"devices/{device_id}/zones/{zone_id}",
+            {property_name: value},
+            requested,
+        )
+        self._invalidate(f"devices/{device_id}/smart-home-zones")
         resp.raise_for_status()
         return resp.status == 200
 
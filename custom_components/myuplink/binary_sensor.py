@@ -45,17 +45,20 @@ async def async_setup_entry(
 class MyUplinkParameterBinarySensorEntity(MyUplinkParameterEntity, BinarySensorEntity):
     """Representation of a myUplink paramater binary sensor."""
 
-    def _update_from_parameter(self, parameter: Parameter) -> None:
-        """Update attrs from parameter."""
-        super()._update_from_parameter(parameter)
-        self._attr_is_on = bool(int(self._parameter.value))
-
+    def _update_config_from_parameter(self, parameter: Parameter) -> None:
+        """Update attrs from parameter metadata."""
+        super()._update_config_from_parameter(parameter)
         if self._parameter.id == 10733:
-            self._attr_is_on = not bool(int(self._parameter.value))
             self._attr_device_class = BinarySensorDeviceClass.LOCK
         elif self._parameter.id in (10905, 10906):
             self._attr_device_class = BinarySensorDeviceClass.RUNNING
 
+    def _update_value_from_parameter(self, parameter: Parameter) -> None:
+        """Update the state from the parameter value."""
+        self._attr_is_on = bool(int(self._parameter.value))
+        if self._parameter.id == 10733:
+            self._attr_is_on = not self._attr_is_on
+
 
 class MyUplinkConnectedBinarySensor(MyUplinkDeviceEntity, BinarySensorEntity):
     """Representation of an myUplink connected sensor."""
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from aiohttp import ClientError
+
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityFeature,
@@ -32,6 +34,12 @@ THERMOSTAT_MODE_MAP_INVERTED: dict[HVACMode, str] = {
     HVACMode.COOL: "cool",
     HVACMode.HEAT_COOL: "heatcool",
 }
+# Zone property holding the target temperature of a zone mode
+SETPOINT_PROPERTY_MAP: dict[str, str] = {
+    "heatcool": "setpoint",
+    "heat": "setpointHeat",
+    "cool": "setpointCool",
+}
 
 
 async def async_setup_entry(
@@ -98,14 +106,22 @@ class MyUplinkZoneClimateEntity(MyUplinkZoneEntity, ClimateEntity):
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature = float(kwargs.get(ATTR_TEMPERATURE))
-        if self._zone.mode == "heatcool":
-            await self._zone.update_zone_property("setpoint", temperature)
-        elif self._zone.mode == "heat":
-            await self._zone.update_zone_property("setpointHeat", temperature)
-        elif self._zone.mode == "cool":
-            await self._zone.update_zone_property("setpointCool", temperature)
+        property_name = SETPOINT_PROPERTY_MAP.get(self._zone.mode)
+
+        # Show the new setpoint while the write waits for the quiet period.
         self._attr_target_temperature = temperature
         self.async_write_ha_state()
+        if property_name is None:
+            return
+
+        try:
+            await self._zone.update_zone_property(
+                property_name, temperature, debounce=True
+            )
+        except ClientError:
+            self._update_from_zone(self._zone)
+            self.async_write_ha_state()
+            raise
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
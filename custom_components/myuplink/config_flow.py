@@ -24,26 +24,42 @@ from homeassistant.helpers import config_entry_oauth2_flow, selector
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
+    CONF_ADAPTIVE_MAX_INTERVAL,
+    CONF_ADAPTIVE_MIN_INTERVAL,
+    CONF_ADAPTIVE_SCAN_INTERVAL,
     CONF_ADDITIONAL_PARAMETER,
     CONF_DISCONNECTED_AVAILABLE,
     CONF_ENABLE_SMART_HOME_MODE,
     CONF_ENABLE_SMART_HOME_ZONE,
+    CONF_ENABLE_TRACING,
+    CONF_ENFORCE_RATE_BUDGET,
     CONF_EXPERT_MODE,
     CONF_FETCH_FIRMWARE,
     CONF_FETCH_NOTIFICATIONS,
+    CONF_MIN_STATE_INTERVAL,
     CONF_PARAMETER_WHITELIST,
     CONF_PLATFORM_OVERRIDE,
+    CONF_RECORD_TRAFFIC,
+    CONF_STATE_DEADBANDS,
     CONF_WRITABLE_OVERRIDE,
     CONF_WRITABLE_WITHOUT_SUBSCRIPTION,
+    CONF_WRITE_DEBOUNCE,
+    DEFAULT_ADAPTIVE_MAX_INTERVAL,
+    DEFAULT_ADAPTIVE_MIN_INTERVAL,
     DEFAULT_PLATFORM_OVERRIDE,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_WRITE_DEBOUNCE,
     DEFAULT_WRITABLE_OVERRIDE,
     DOMAIN,
+    MAX_ADAPTIVE_INTERVAL,
+    MAX_MIN_STATE_INTERVAL,
     MAX_SCAN_INTERVAL,
+    MAX_WRITE_DEBOUNCE,
     MIN_SCAN_INTERVAL,
     SCAN_INTERVAL_STEP,
     SCOPES,
 )
+from .planner import estimate_requests_per_cycle, minimum_scan_interval
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -79,6 +95,10 @@ def get_options_schema(data: ConfigType) -> Schema:
                     unit_of_measurement=UnitOfTime.SECONDS,
                 )
             ),
+            vol.Required(
+                CONF_ENFORCE_RATE_BUDGET,
+                default=data.get(CONF_ENFORCE_RATE_BUDGET, False),
+            ): selector.BooleanSelector(),
             vol.Required(
                 CONF_DISCONNECTED_AVAILABLE,
                 default=data.get(CONF_DISCONNECTED_AVAILABLE, False),
@@ -91,6 +111,27 @@ def get_options_schema(data: ConfigType) -> Schema:
     )
 
 
+def get_options_placeholders(
+    data: ConfigType, config_entry: ConfigEntry | None = None
+) -> dict[str, str]:
+    """Return the description placeholders of the options step."""
+    systems = None
+    rate_limit = None
+    if config_entry is not None and (
+        coordinator := getattr(config_entry, "runtime_data", None)
+    ):
+        systems = coordinator.data
+        rate_limit = coordinator.api.auth.rate_limit_limit
+
+    return {
+        "min_scan_interval": str(
+            minimum_scan_interval(
+                estimate_requests_per_cycle(data, systems), rate_limit
+            )
+        )
+    }
+
+
 def get_expert_schema(data: ConfigType) -> Schema:
     """Return the expert schema."""
     try:
@@ -125,6 +166,11 @@ def get_expert_schema(data: ConfigType) -> Schema:
     except json.decoder.JSONDecodeError:
         additional_parameter = "[]"
 
+    try:
+        state_deadbands = json.dumps(json.loads(data.get(CONF_STATE_DEADBANDS, "{}")))
+    except json.decoder.JSONDecodeError:
+        state_deadbands = "{}"
+
     return vol.Schema(
         {
             vol.Optional(
@@ -147,6 +193,74 @@ def get_expert_schema(data: ConfigType) -> Schema:
                 CONF_ADDITIONAL_PARAMETER,
                 default=additional_parameter,
             ): selector.TextSelector(selector.TextSelectorConfig(multiline=True)),
+            vol.Optional(
+                CONF_ADAPTIVE_SCAN_INTERVAL,
+                default=data.get(CONF_ADAPTIVE_SCAN_INTERVAL, False),
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_ADAPTIVE_MIN_INTERVAL,
+                default=data.get(
+                    CONF_ADAPTIVE_MIN_INTERVAL, DEFAULT_ADAPTIVE_MIN_INTERVAL
+                ),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=MIN_SCAN_INTERVAL,
+                    max=MAX_ADAPTIVE_INTERVAL,
+                    mode=selector.NumberSelectorMode.BOX,
+                    step=SCAN_INTERVAL_STEP,
+                    unit_of_measurement=UnitOfTime.SECONDS,
+                )
+            ),
+            vol.Optional(
+                CONF_ADAPTIVE_MAX_INTERVAL,
+                default=data.get(
+                    CONF_ADAPTIVE_MAX_INTERVAL, DEFAULT_ADAPTIVE_MAX_INTERVAL
+                ),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=MIN_SCAN_INTERVAL,
+                    max=MAX_ADAPTIVE_INTERVAL,
+                    mode=selector.NumberSelectorMode.BOX,
+                    step=SCAN_INTERVAL_STEP,
+                    unit_of_measurement=UnitOfTime.SECONDS,
+                )
+            ),
+            vol.Optional(
+                CONF_WRITE_DEBOUNCE,
+                default=data.get(CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=MAX_WRITE_DEBOUNCE,
+                    mode=selector.NumberSelectorMode.BOX,
+                    step=0.5,
+                    unit_of_measurement=UnitOfTime.SECONDS,
+                )
+            ),
+            vol.Optional(
+                CONF_STATE_DEADBANDS,
+                default=state_deadbands,
+            ): selector.TextSelector(selector.TextSelectorConfig(multiline=True)),
+            vol.Optional(
+                CONF_MIN_STATE_INTERVAL,
+                default=data.get(CONF_MIN_STATE_INTERVAL, 0),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=MAX_MIN_STATE_INTERVAL,
+                    mode=selector.NumberSelectorMode.BOX,
+                    step=1,
+                    unit_of_measurement=UnitOfTime.SECONDS,
+                )
+            ),
+            vol.Optional(
+                CONF_ENABLE_TRACING,
+                default=data.get(CONF_ENABLE_TRACING, False),
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_RECORD_TRAFFIC,
+                default=data.get(CONF_RECORD_TRAFFIC, False),
+            ): selector.BooleanSelector(),
         }
     )
 
@@ -223,7 +337,9 @@ class OAuth2FlowHandler(
         """Handle the options step."""
         if options_input is None:
             return self.async_show_form(
-                step_id="options", data_schema=get_options_schema(self._options)
+                step_id="options",
+                data_schema=get_options_schema(self._options),
+                description_placeholders=get_options_placeholders(self._options),
             )
         self._options = options_input
         if options_input.get(CONF_EXPERT_MODE, False):
@@ -269,7 +385,11 @@ class OptionsFlow(OptionsFlowWithConfigEntry):
         """Handle the options step."""
         if options_input is None:
             return self.async_show_form(
-                step_id="options", data_schema=get_options_schema(self.options)
+                step_id="options",
+                data_schema=get_options_schema(self.options),
+                description_placeholders=get_options_placeholders(
+                    self.options, self.config_entry
+                ),
             )
         self.options.update(options_input)
         if options_input.get(CONF_EXPERT_MODE, False):
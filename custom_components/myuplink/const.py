@@ -20,6 +20,16 @@ SCOPES = [
 API_HOST = "https://api.myuplink.com"
 API_VERSION = "v2"
 
+# Connection pool of the dedicated client session. Reads and writes take turns
+# in the request slot, so one connection to the API host is enough.
+CONNECTION_LIMIT_PER_HOST = 1
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 300
+
+# Timeouts in seconds for a single API request
+CONNECT_TIMEOUT = 10
+REQUEST_TIMEOUT = 20
+
 PLATFORMS = [
     Platform.BINARY_SENSOR,
     Platform.CLIMATE,
@@ -31,28 +41,83 @@ PLATFORMS = [
     Platform.WATER_HEATER,
 ]
 
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_CYCLES = "cycles"
+ATTR_MAX_AGE = "max_age"
 ATTR_PARAMETER_ID = "parameter_id"
+ATTR_PARAMETER_IDS = "parameter_ids"
 ATTR_PROPERTY_NAME = "property_name"
 ATTR_VALUE = "value"
+ATTR_VALUES = "values"
 ATTR_ZONE_ID = "zone_id"
 
+CONF_ADAPTIVE_SCAN_INTERVAL = "adaptive_scan_interval"
+CONF_ADAPTIVE_MAX_INTERVAL = "adaptive_max_interval"
+CONF_ADAPTIVE_MIN_INTERVAL = "adaptive_min_interval"
 CONF_ADDITIONAL_PARAMETER = "additional_parameter"
 CONF_DISCONNECTED_AVAILABLE = "disconnected_available"
 CONF_ENABLE_SMART_HOME_MODE = "enable_smart_home_mode"
 CONF_ENABLE_SMART_HOME_ZONE = "enable_smart_home_zone"
+CONF_ENABLE_TRACING = "enable_tracing"
+CONF_ENFORCE_RATE_BUDGET = "enforce_rate_budget"
 CONF_EXPERT_MODE = "expert_mode"
 CONF_FETCH_FIRMWARE = "fetch_firmware"
 CONF_FETCH_NOTIFICATIONS = "fetch_notifications"
 CONF_PARAMETER_WHITELIST = "parameter_whitelist"
 CONF_PLATFORM_OVERRIDE = "platform_override"
+CONF_MIN_STATE_INTERVAL = "min_state_interval"
+CONF_RECORD_TRAFFIC = "record_traffic"
+CONF_STATE_DEADBANDS = "state_deadbands"
 CONF_WRITABLE_OVERRIDE = "writable_override"
 CONF_WRITABLE_WITHOUT_SUBSCRIPTION = "writable_without_subscription"
+CONF_WRITE_DEBOUNCE = "write_debounce"
 
 DEFAULT_SCAN_INTERVAL = 300
 MAX_SCAN_INTERVAL = 600
 MIN_SCAN_INTERVAL = 5
 SCAN_INTERVAL_STEP = 5
 
+DEFAULT_ADAPTIVE_MAX_INTERVAL = 900
+DEFAULT_ADAPTIVE_MIN_INTERVAL = 60
+MAX_ADAPTIVE_INTERVAL = 3600
+
+# Quiet period in seconds before debounced entity writes are sent
+DEFAULT_WRITE_DEBOUNCE = 1.0
+MAX_WRITE_DEBOUNCE = 10
+
+# Longest configurable time in seconds between state writes of a parameter
+MAX_MIN_STATE_INTERVAL = 3600
+
+# Seconds a written parameter value is shown until the API confirms it
+PENDING_WRITE_TTL = 300
+
+# Write statuses of parameters whose value is shown until the API confirms it,
+# an empty status or "sent" means the API did not report a status
+ACCEPTED_WRITE_STATUSES = ("", "modified", "pending", "sent")
+
+# Requests allowed per rate limit window if the API did not report a limit yet
+DEFAULT_RATE_LIMIT = 25
+RATE_LIMIT_WINDOW = 60
+
+# Number of refresh cycles kept for diagnostics
+CYCLE_HISTORY_SIZE = 20
+
+# Seconds a parameter value is answered from the last fetch by the read service
+DEFAULT_PARAMETER_MAX_AGE = 30
+
+# Dispatcher signal for a parameter read outside of the refresh cycle,
+# formatted with the device and parameter id
+SIGNAL_PARAMETER_UPDATED = f"{DOMAIN}_parameter_updated_{{}}_{{}}"
+
+# Seconds a finished GET result is shared with identical follow-up requests
+SINGLE_FLIGHT_RESULT_TTL = 2
+
+# File in the configuration directory receiving the refresh cycle trace spans
+TRACE_FILENAME = "myuplink_trace.jsonl"
+
+# File in the configuration directory receiving the recorded API traffic
+RECORDING_FILENAME = "myuplink_recording.jsonl.gz"
+
 DEFAULT_PLATFORM_OVERRIDE = {
     10733: Platform.BINARY_SENSOR,
     44703: Platform.BINARY_SENSOR,
@@ -80,6 +145,9 @@ DEFAULT_WRITABLE_OVERRIDE = {
 
 WATER_HEATERS = ["18760NE"]
 
+# Parameters of the water heater entity, always polled with a whitelist
+WATER_HEATER_PARAMETERS = [406, 500, 516, 527, 528]
+
 
 class CustomUnits(StrEnum):
     """Custom units."""
@@ -0,0 +1,231 @@
+"""Data update coordinator for the myUplink integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+from time import monotonic
+
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .api import Device, MyUplink, System
+from .const import (
+    CONF_ADAPTIVE_MAX_INTERVAL,
+    CONF_ADAPTIVE_MIN_INTERVAL,
+    CONF_ADAPTIVE_SCAN_INTERVAL,
+    CONF_ENFORCE_RATE_BUDGET,
+    CYCLE_HISTORY_SIZE,
+    DEFAULT_ADAPTIVE_MAX_INTERVAL,
+    DEFAULT_ADAPTIVE_MIN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
+from .planner import (
+    AdaptiveInterval,
+    estimate_requests_per_cycle,
+    minimum_scan_interval,
+)
+from .tracing import Span
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class CycleStats:
+    """Statistics of a single refresh cycle."""
+
+    duration: float
+    requests: int
+    failed_requests: int
+    throttle_wait: float
+
+
+class MyUplinkDataUpdateCoordinator(DataUpdateCoordinator[list[System]]):
+    """Coordinator fetching all systems of a myUplink account."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, api: MyUplink) -> None:
+        """Initialize the coordinator."""
+        self.api = api
+        self.entry = entry
+        self.scan_interval = timedelta(
+            seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self.minimum_interval: timedelta | None = None
+        self.last_cycle: CycleStats | None = None
+        self.cycle_history: deque[CycleStats] = deque(maxlen=CYCLE_HISTORY_SIZE)
+        self.adaptive_interval: AdaptiveInterval | None = None
+        self._cycle_span: Span | None = None
+        # Home Assistant device id to myUplink id, kept by registry events
+        self._device_ids: dict[str, str] = {}
+        # myUplink device id to the device of the last refresh
+        self._devices: dict[str, Device] = {}
+        if entry.options.get(CONF_ADAPTIVE_SCAN_INTERVAL, False):
+            self.adaptive_interval = AdaptiveInterval(
+                floor=timedelta(
+                    seconds=entry.options.get(
+                        CONF_ADAPTIVE_MIN_INTERVAL, DEFAULT_ADAPTIVE_MIN_INTERVAL
+                    )
+                ),
+                ceiling=timedelta(
+                    seconds=entry.options.get(
+                        CONF_ADAPTIVE_MAX_INTERVAL, DEFAULT_ADAPTIVE_MAX_INTERVAL
+                    )
+                ),
+                start=self.scan_interval,
+            )
+
+        _LOGGER.debug(
+            "Initialize coordinator with %d seconds update interval",
+            self.scan_interval.total_seconds(),
+        )
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="myUplink",
+            update_interval=self.scan_interval,
+        )
+
+    async def _async_update_data(self) -> list[System]:
+        """Fetch all systems from the myUplink API."""
+        auth = self.api.auth
+        changed_values = self.api.changed_values
+        requests = auth.request_count
+        failed_requests = auth.failed_count
+        throttle_wait = auth.throttle_wait_seconds
+        start = monotonic()
+
+        try:
+            with self.api.tracer.span("cycle") as self._cycle_span:
+                async with asyncio.timeout(30):
+                    systems = await self.api.get_systems()
+        except aiohttp.ClientResponseError as err:
+            raise UpdateFailed(f"Wrong credentials: {err}") from err
+        except aiohttp.ClientConnectorError as err:
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
+        finally:
+            self.last_cycle = CycleStats(
+                duration=monotonic() - start,
+                requests=auth.request_count - requests,
+                failed_requests=auth.failed_count - failed_requests,
+                throttle_wait=auth.throttle_wait_seconds - throttle_wait,
+            )
+            self.cycle_history.append(self.last_cycle)
+
+        self._async_adjust_update_interval(
+            systems, self.api.changed_values - changed_values
+        )
+        self._devices = {
+            device.id: device for system in systems for device in system.devices
+        }
+
+        return systems
+
+    @callback
+    def async_setup_device_index(self) -> None:
+        """Index the registry devices of the entry and keep the index updated."""
+        device_registry = dr.async_get(self.hass)
+        for device_entry in dr.async_entries_for_config_entry(
+            device_registry, self.entry.entry_id
+        ):
+            self._async_index_device(device_entry)
+
+        self.entry.async_on_unload(
+            self.hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated
+            )
+        )
+
+    @callback
+    def _async_index_device(self, device_entry: dr.DeviceEntry) -> None:
+        """Add or remove a registry device in the index."""
+        self._device_ids.pop(device_entry.id, None)
+        if self.entry.entry_id not in device_entry.config_entries:
+            return
+        for domain, identifier in device_entry.identifiers:
+            if domain == DOMAIN:
+                self._device_ids[device_entry.id] = identifier
+
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        """Update the index after a registry device changed."""
+        device_id = event.data["device_id"]
+        if event.data["action"] == "remove":
+            self._device_ids.pop(device_id, None)
+        elif device_entry := dr.async_get(self.hass).async_get(device_id):
+            self._async_index_device(device_entry)
+
+    def get_device(self, device_id: str) -> Device | None:
+        """Return the myUplink device of a Home Assistant device id."""
+        if (myuplink_id := self._device_ids.get(device_id)) is None:
+            return None
+        return self._devices.get(myuplink_id)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all listeners and write the trace and traffic of the cycle."""
+        tracer = self.api.tracer
+        with tracer.span("dispatch", parent=self._cycle_span):
+            super().async_update_listeners()
+        self._cycle_span = None
+
+        if lines := tracer.pop_lines():
+            self.hass.async_add_executor_job(tracer.write, lines)
+
+        recorder = self.api.auth.recorder
+        if recorder is not None and (lines := recorder.pop_lines()):
+            self.hass.async_add_executor_job(recorder.write, lines)
+
+    def _async_adjust_update_interval(
+        self, systems: list[System], changed_values: int
+    ) -> None:
+        """Adjust the update interval to the change rate and the rate limit."""
+        self.minimum_interval = timedelta(
+            seconds=minimum_scan_interval(
+                estimate_requests_per_cycle(self.entry.options, systems),
+                self.api.auth.rate_limit_limit,
+            )
+        )
+
+        interval = self.scan_interval
+        if self.adaptive_interval is not None:
+            interval = self.adaptive_interval.update(
+                changed_values,
+                self.api.auth.rate_limit_remaining,
+                self.api.auth.rate_limit_limit,
+            )
+
+        if self.entry.options.get(CONF_ENFORCE_RATE_BUDGET, False):
+            interval = max(interval, self.minimum_interval)
+
+        if interval != self.update_interval:
+            _LOGGER.debug(
+                "Change update interval to %d seconds (%d changed values)",
+                interval.total_seconds(),
+                changed_values,
+            )
+            self.update_interval = interval
+
+    async def async_profile_refresh(
+        self, start: Callable[[], object], stop: Callable[[], object], cycles: int
+    ) -> None:
+        """Run refresh cycles including the entity updates under a profiler.
+
+        The profiler is started before and stopped after every cycle.
+        """
+        for _ in range(cycles):
+            start()
+            try:
+                await self.async_refresh()
+            finally:
+                stop()
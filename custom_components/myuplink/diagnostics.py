@@ -0,0 +1,195 @@
+"""Diagnostics support for the myUplink integration."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+import sys
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .api import System
+from .coordinator import MyUplinkDataUpdateCoordinator
+
+TO_REDACT = {
+    "access_token",
+    "refresh_token",
+    "id",
+    "deviceId",
+    "systemId",
+    "serialNumber",
+    "name",
+    "userId",
+}
+
+
+def _approximate_size(obj: Any, seen: set[int] | None = None) -> int:
+    """Return the approximate memory in bytes held by a parsed JSON object."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(
+            _approximate_size(key, seen) + _approximate_size(value, seen)
+            for key, value in obj.items()
+        )
+    elif isinstance(obj, list | tuple):
+        size += sum(_approximate_size(item, seen) for item in obj)
+    return size
+
+
+def _model_diagnostics(systems: list[System]) -> dict[str, Any]:
+    """Return object counts and approximate memory of the parsed model."""
+    devices = [device for system in systems for device in system.devices]
+    seen: set[int] = set()
+
+    return {
+        "systems": len(systems),
+        "devices": len(devices),
+        "parameters": sum(len(device.parameters) for device in devices),
+        "zones": sum(len(device.zones) for device in devices),
+        "notifications": sum(len(device.notifications) for device in devices),
+        "approximate_bytes": sum(
+            _approximate_size(raw_data, seen)
+            for raw_data in (
+                *(system.raw_data for system in systems),
+                *(
+                    parameter.raw_data
+                    for device in devices
+                    for parameter in device.parameters
+                ),
+                *(zone.raw_data for device in devices for zone in device.zones),
+            )
+        ),
+    }
+
+
+def _topology_diagnostics(systems: list[System]) -> list[dict[str, Any]]:
+    """Return the redacted systems and devices."""
+    return [
+        {
+            "system": async_redact_data(
+                {
+                    key: value
+                    for key, value in system.raw_data.items()
+                    if key != "devices"
+                },
+                TO_REDACT,
+            ),
+            "premium_manage": system.premium_manage,
+            "smart_home_mode": system.smart_home_mode,
+            "devices": [
+                {
+                    "device": async_redact_data(device.raw_data, TO_REDACT),
+                    "parameters": len(device.parameters),
+                    "zones": len(device.zones),
+                    "notifications": len(device.notifications),
+                }
+                for device in system.devices
+            ],
+        }
+        for system in systems
+    ]
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: MyUplinkDataUpdateCoordinator = entry.runtime_data
+    api = coordinator.api
+    auth = api.auth
+    systems = coordinator.data or []
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "topology": _topology_diagnostics(systems),
+        "model": _model_diagnostics(systems),
+        "scheduler": {
+            "last_update_success": coordinator.last_update_success,
+            "scan_interval": coordinator.scan_interval.total_seconds(),
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "minimum_interval": (
+                coordinator.minimum_interval.total_seconds()
+                if coordinator.minimum_interval
+                else None
+            ),
+            "adaptive_interval": (
+                coordinator.adaptive_interval.interval.total_seconds()
+                if coordinator.adaptive_interval
+                else None
+            ),
+            "changed_values": api.changed_values,
+            "cycles": [asdict(cycle) for cycle in coordinator.cycle_history],
+        },
+        "throttle": {
+            "rate_limit_limit": auth.rate_limit_limit,
+            "rate_limit_remaining": auth.rate_limit_remaining,
+            "rate_limit_reset_at": (
+                auth.rate_limit_reset_at.isoformat()
+                if auth.rate_limit_reset_at
+                else None
+            ),
+            "locked": api.slot.locked(),
+            "queued_writes": api.slot.queued_writes,
+            "queued_reads": api.slot.queued_reads,
+            "requests": auth.request_count,
+            "failed_requests": auth.failed_count,
+            "rate_limited_requests": auth.rate_limited_count,
+            "wait_seconds": auth.throttle_wait_seconds,
+        },
+        "caches": {
+            "single_flight": {
+                "hits": api.single_flight.hits,
+                "misses": api.single_flight.misses,
+                "hit_ratio": api.single_flight.hit_ratio,
+            },
+            "responses": {
+                "not_modified": api.response_cache.not_modified,
+                "unchanged": api.response_cache.unchanged,
+                "decoded": api.response_cache.decoded,
+                "hit_ratio": api.response_cache.hit_ratio,
+                "decode_seconds": api.response_cache.decode_seconds,
+                "decode_seconds_saved": api.response_cache.decode_seconds_saved,
+            },
+            "connections": {
+                "created": auth.connection_stats.created,
+                "reused": auth.connection_stats.reused,
+                "reuse_ratio": auth.connection_stats.reuse_ratio,
+                "dns_cache_hits": auth.connection_stats.dns_cache_hits,
+                "dns_cache_misses": auth.connection_stats.dns_cache_misses,
+                "dns_cache_hit_ratio": auth.connection_stats.dns_cache_hit_ratio,
+            },
+        },
+        "writes": {
+            "collapsed": api.write_debouncer.collapsed,
+            "pending": len(api.pending_writes),
+            "confirmed": api.pending_writes.confirmed,
+            "expired": api.pending_writes.expired,
+            "confirmation_seconds": api.pending_writes.confirmation_seconds,
+            "max_confirmation_seconds": api.pending_writes.max_confirmation_seconds,
+            "latency": asdict(api.write_latency),
+        },
+        "state_writes": {
+            "deadbands": len(api.state_filter.deadbands),
+            "min_interval": api.state_filter.min_interval,
+            "written": api.state_filter.written,
+            "unchanged": api.state_filter.unchanged,
+            "suppressed_deadband": api.state_filter.suppressed_deadband,
+            "suppressed_interval": api.state_filter.suppressed_interval,
+        },
+        "requests": auth.request_stats.as_dict(),
+    }
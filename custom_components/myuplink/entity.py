@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+from time import monotonic
+from typing import Any
+
+from homeassistant.const import EntityCategory
 from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -10,7 +16,32 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from .api import Device, Parameter, System, Zone
-from .const import CONF_DISCONNECTED_AVAILABLE, DOMAIN
+from .const import CONF_DISCONNECTED_AVAILABLE, DOMAIN, SIGNAL_PARAMETER_UPDATED
+from .coordinator import MyUplinkDataUpdateCoordinator
+from .state_filter import Deadband
+
+
+class MyUplinkApiEntity(CoordinatorEntity[MyUplinkDataUpdateCoordinator]):
+    """Base class for myUplink API entities of a config entry."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: MyUplinkDataUpdateCoordinator, key: str) -> None:
+        """Initialize class."""
+        super().__init__(coordinator)
+        self._attr_translation_key = f"{DOMAIN}_{key}"
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.entry.entry_id}_{key}"
+
+    @property
+    def device_info(self):
+        """Return the device_info of the API connection."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.coordinator.entry.entry_id)},
+            entry_type=DeviceEntryType.SERVICE,
+            manufacturer="myUplink",
+            name=f"{self.coordinator.entry.title} API",
+        )
 
 
 class MyUplinkSystemEntity(CoordinatorEntity):
@@ -99,6 +130,16 @@ class MyUplinkDeviceEntity(CoordinatorEntity):
 class MyUplinkParameterEntity(MyUplinkDeviceEntity):
     """Representation of a myUplink parameter entity."""
 
+    _metadata_fingerprint: tuple | None = None
+
+    # Numeric states may be skipped by the state write filter of the API
+    _filter_state_writes = False
+    _deadband: Deadband | None = None
+    _config_changed = True
+    _written_value: Any = None
+    _written_at: float | None = None
+    _written_available: bool | None = None
+
     def __init__(
         self, coordinator: DataUpdateCoordinator, device: Device, parameter: Parameter
     ) -> None:
@@ -107,14 +148,84 @@ class MyUplinkParameterEntity(MyUplinkDeviceEntity):
         self._update_from_parameter(parameter)
 
     def _update_from_parameter(self, parameter: Parameter) -> None:
-        """Update attrs from parameter."""
+        """Update attrs from parameter.
+
+        The configuration is only updated if the metadata of the parameter
+        changed, usually just the value changes between polls.
+        """
         self._parameter = parameter
+        fingerprint = (parameter.metadata_fingerprint, self._device.name)
+        if fingerprint != self._metadata_fingerprint:
+            self._metadata_fingerprint = fingerprint
+            self._update_config_from_parameter(parameter)
+            self._config_changed = True
+            if self._filter_state_writes:
+                self._deadband = self._device.system.api.state_filter.deadband(
+                    parameter.id, getattr(self, "_attr_device_class", None)
+                )
+        self._update_value_from_parameter(parameter)
+
+    def _update_config_from_parameter(self, parameter: Parameter) -> None:
+        """Update name, unit, limits and options from parameter metadata."""
         if self._parameter.category and self._device.name != self._parameter.category:
             self._attr_name = f"{self._parameter.category} {self._parameter.name} ({self._parameter.id})"
         else:
             self._attr_name = f"{self._parameter.name} ({self._parameter.id})"
         self._attr_unique_id = f"{DOMAIN}_{self._device.id}_{self._parameter.id}"
 
+    def _update_value_from_parameter(self, parameter: Parameter) -> None:
+        """Update the state from the parameter value."""
+
+    @property
+    def _filtered_value(self) -> Any:
+        """Return the value compared by the state write filter."""
+        return self._parameter.value
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to reads of the parameter outside of the refresh cycle."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_PARAMETER_UPDATED.format(self._device.id, self._parameter.id),
+                self._handle_parameter_update,
+            )
+        )
+
+    @callback
+    def _handle_parameter_update(self, parameter: Parameter) -> None:
+        """Handle a parameter read outside of the refresh cycle."""
+        self._update_from_parameter(parameter)
+        self._async_write_parameter_state()
+
+    @callback
+    def _async_write_parameter_state(self) -> None:
+        """Write the state after a parameter update unless the filter skips it.
+
+        Configuration and availability changes are always written.
+        """
+        state_filter = self._device.system.api.state_filter
+        if not self._filter_state_writes or not state_filter.enabled:
+            super().async_write_ha_state()
+            return
+
+        value = self._filtered_value
+        available = self.available
+        if (
+            not self._config_changed
+            and available == self._written_available
+            and not state_filter.should_write(
+                self._deadband, self._written_value, self._written_at, value
+            )
+        ):
+            return
+
+        self._config_changed = False
+        self._written_value = value
+        self._written_at = monotonic()
+        self._written_available = available
+        super().async_write_ha_state()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -122,11 +233,12 @@ class MyUplinkParameterEntity(MyUplinkDeviceEntity):
             for device in system.devices:
                 if device.id == self._device.id:
                     super()._update_from_device(device)
-                    for parameter in device.parameters:
-                        if parameter.id == self._parameter.id:
-                            self._update_from_parameter(parameter)
+                    if (
+                        parameter := device.parameter_index.get(self._parameter.id)
+                    ) is not None:
+                        self._update_from_parameter(parameter)
 
-        super().async_write_ha_state()
+        self._async_write_parameter_state()
 
     @property
     def available(self):
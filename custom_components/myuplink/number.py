@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from aiohttp import ClientError
+
 from homeassistant.components.number import NumberDeviceClass, NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .api import Device, Parameter, System
@@ -40,9 +43,11 @@ async def async_setup_entry(
 class MyUplinkParameterNumberEntity(MyUplinkParameterEntity, NumberEntity):
     """Representation of a myUplink paramater binary sensor."""
 
-    def _update_from_parameter(self, parameter: Parameter) -> None:
-        """Update attrs from parameter."""
-        super()._update_from_parameter(parameter)
+    _filter_state_writes = True
+
+    def _update_config_from_parameter(self, parameter: Parameter) -> None:
+        """Update attrs from parameter metadata."""
+        super()._update_config_from_parameter(parameter)
         unit_conversion = {
             "°C": NumberDeviceClass.TEMPERATURE,
             "°F": NumberDeviceClass.TEMPERATURE,
@@ -58,9 +63,27 @@ class MyUplinkParameterNumberEntity(MyUplinkParameterEntity, NumberEntity):
         if parameter.step_value is not None:
             self._attr_native_step = parameter.step_value * parameter.scale_value
 
+    def _update_value_from_parameter(self, parameter: Parameter) -> None:
+        """Update the state from the parameter value."""
         self._attr_native_value = parameter.value
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await self._parameter.update_parameter(value)
+        if not self._parameter.is_writable:
+            raise HomeAssistantError(
+                f"Parameter {self._parameter.id} of device {self._device.id}"
+                " is not writable"
+            )
+        # Show the new value while the write waits for the quiet period.
+        self._attr_native_value = value
+        self.async_write_ha_state()
+        # The filter compares with the last filtered write, so the state of
+        # the next update has to be written to replace the optimistic one.
+        self._config_changed = True
+        try:
+            await self._parameter.update_parameter(value, debounce=True)
+        except ClientError:
+            self._update_from_parameter(self._parameter)
+            self.async_write_ha_state()
+            raise
         await self.async_update()
@@ -0,0 +1,128 @@
+"""Rate budget planning for the myUplink integration."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import timedelta
+import json
+from math import ceil
+from typing import Any
+
+from .api import MyUplink, System
+from .const import (
+    CONF_ADDITIONAL_PARAMETER,
+    CONF_ENABLE_SMART_HOME_MODE,
+    CONF_ENABLE_SMART_HOME_ZONE,
+    CONF_FETCH_FIRMWARE,
+    CONF_FETCH_NOTIFICATIONS,
+    CONF_PARAMETER_WHITELIST,
+    DEFAULT_RATE_LIMIT,
+    MIN_SCAN_INTERVAL,
+    RATE_LIMIT_WINDOW,
+    SCAN_INTERVAL_STEP,
+)
+
+
+def _json_list(options: Mapping[str, Any], key: str) -> list:
+    """Return a JSON list option, empty if missing or invalid."""
+    try:
+        value = json.loads(options.get(key, "[]"))
+    except json.decoder.JSONDecodeError:
+        return []
+    return value if isinstance(value, list) else []
+
+
+def _pages(items: int) -> int:
+    """Return the number of requests to fetch a paginated resource."""
+    return max(ceil(items / MyUplink.ITEMS_PER_PAGE), 1)
+
+
+def estimate_requests_per_cycle(
+    options: Mapping[str, Any], systems: list[System] | None = None
+) -> int:
+    """Return the number of API requests of one refresh cycle.
+
+    Without a known topology, a single system with a single device is assumed.
+    """
+    if len(_json_list(options, CONF_PARAMETER_WHITELIST)) > 0:
+        points_requests = 1
+    else:
+        points_requests = 1 + (len(_json_list(options, CONF_ADDITIONAL_PARAMETER)) > 0)
+
+    device_requests = (
+        points_requests
+        + options.get(CONF_FETCH_FIRMWARE, True)
+        + options.get(CONF_ENABLE_SMART_HOME_ZONE, True)
+    )
+
+    # (number of devices, number of notifications) per system
+    topology = [
+        (
+            len(system.devices),
+            sum(len(device.notifications) for device in system.devices),
+        )
+        for system in systems or []
+    ] or [(1, 0)]
+
+    requests = _pages(len(topology))
+    for device_count, notification_count in topology:
+        # Subscriptions are requested for every system.
+        requests += 1
+        if options.get(CONF_ENABLE_SMART_HOME_MODE, True):
+            requests += 1
+        if options.get(CONF_FETCH_NOTIFICATIONS, True):
+            requests += _pages(notification_count)
+        requests += device_count * device_requests
+
+    return requests
+
+
+def minimum_scan_interval(requests_per_cycle: int, limit: int | None = None) -> int:
+    """Return the shortest scan interval staying within the rate limit.
+
+    The interval is rounded up to the step of the scan interval option.
+    """
+    limit = limit or DEFAULT_RATE_LIMIT
+    seconds = ceil(requests_per_cycle * RATE_LIMIT_WINDOW / limit)
+    seconds = ceil(seconds / SCAN_INTERVAL_STEP) * SCAN_INTERVAL_STEP
+    return max(seconds, MIN_SCAN_INTERVAL)
+
+
+class AdaptiveInterval:
+    """Adapt the update interval to how quickly parameter values change.
+
+    The interval shrinks while many values change per cycle and the rate
+    limit window has headroom left, and grows while nothing changes. It is
+    always kept between the configured floor and ceiling.
+    """
+
+    # Changed values per cycle considered as busy
+    BUSY_CHANGES = 5
+    # Minimum share of the rate limit that must remain to shrink the interval
+    MIN_HEADROOM = 0.5
+    SHRINK_FACTOR = 0.5
+    GROW_FACTOR = 1.5
+
+    def __init__(self, floor: timedelta, ceiling: timedelta, start: timedelta) -> None:
+        """Initialize adaptive interval."""
+        self.floor = floor
+        self.ceiling = max(floor, ceiling)
+        self.interval = self._clamp(start)
+
+    def _clamp(self, interval: timedelta) -> timedelta:
+        """Return interval bounded by floor and ceiling."""
+        return min(max(interval, self.floor), self.ceiling)
+
+    def update(
+        self, changes: int, remaining: int | None, limit: int | None
+    ) -> timedelta:
+        """Return the next interval for the changes of the last cycle."""
+        limit = limit or DEFAULT_RATE_LIMIT
+        has_headroom = remaining is None or remaining >= limit * self.MIN_HEADROOM
+
+        if changes >= self.BUSY_CHANGES and has_headroom:
+            self.interval = self._clamp(self.interval * self.SHRINK_FACTOR)
+        elif changes == 0 or not has_headroom:
+            self.interval = self._clamp(self.interval * self.GROW_FACTOR)
+
+        return self.interval
@@ -0,0 +1,172 @@
+"""Record myUplink API traffic to a compressed JSON lines file."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import gzip
+import json
+import re
+from time import time
+from typing import Any
+
+REDACTED = "**REDACTED**"
+
+# Device ids contain the serial number and MAC address of the device
+DEVICE_PSEUDONYM_PREFIX = "device-"
+_DEVICE_PATH_ID = re.compile(r"(?<=devices/)[^/]+")
+
+# Keys whose values are replaced in recorded headers and payloads
+TO_REDACT = {
+    "access_token",
+    "authorization",
+    "refresh_token",
+    "serialNumber",
+}
+
+# Response headers kept in a recording
+RECORDED_HEADERS = (
+    "Content-Type",
+    "ETag",
+    "Last-Modified",
+    "RateLimit-Limit",
+    "RateLimit-Remaining",
+    "RateLimit-Reset",
+)
+
+
+def redact(data: Any) -> Any:
+    """Return data with the values of sensitive keys replaced."""
+    if isinstance(data, dict):
+        return {
+            key: REDACTED if key in TO_REDACT else redact(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [redact(item) for item in data]
+    return data
+
+
+def _device_ids(data: Any, in_devices: bool = False) -> Iterator[str]:
+    """Yield the device ids of deviceId keys and of the id keys of devices."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key == "deviceId" or in_devices and key == "id":
+                if isinstance(value, str):
+                    yield value
+            else:
+                yield from _device_ids(value, key == "devices")
+    elif isinstance(data, list):
+        for item in data:
+            yield from _device_ids(item, in_devices)
+
+
+class DevicePseudonyms:
+    """Replace device ids with pseudonyms numbered in order of appearance.
+
+    The same device id gets the same pseudonym in paths and payloads, so a
+    recording can still be replayed. Pseudonyms are kept as they are, so
+    replacing them again does not change a recording.
+    """
+
+    def __init__(self) -> None:
+        """Initialize pseudonyms."""
+        self._pseudonyms: dict[str, str] = {}
+
+    def pseudonym(self, device_id: str) -> str:
+        """Return the pseudonym of a device id."""
+        if device_id.startswith(DEVICE_PSEUDONYM_PREFIX):
+            return device_id
+        if (pseudonym := self._pseudonyms.get(device_id)) is None:
+            pseudonym = self._pseudonyms[device_id] = (
+                f"{DEVICE_PSEUDONYM_PREFIX}{len(self._pseudonyms) + 1}"
+            )
+        return pseudonym
+
+    def _replace(self, data: Any) -> Any:
+        """Return data with known device ids replaced."""
+        if isinstance(data, dict):
+            return {key: self._replace(value) for key, value in data.items()}
+        if isinstance(data, list):
+            return [self._replace(item) for item in data]
+        if isinstance(data, str) and data in self._pseudonyms:
+            return self._pseudonyms[data]
+        return data
+
+    def apply(self, path: str, request: Any, body: Any) -> tuple[str, Any, Any]:
+        """Return path, decoded request and response body with pseudonyms."""
+        for device_id in _device_ids(body):
+            self.pseudonym(device_id)
+        path = _DEVICE_PATH_ID.sub(lambda match: self.pseudonym(match[0]), path)
+        return path, self._replace(request), self._replace(body)
+
+
+def _decode(body: str | bytes | None) -> Any:
+    """Return a JSON body decoded, other bodies as text."""
+    if not body:
+        return None
+    try:
+        return json.loads(body)
+    except ValueError:
+        return body.decode(errors="replace") if isinstance(body, bytes) else body
+
+
+class TrafficRecorder:
+    """Collect request and response pairs for writing them in batches.
+
+    Every exchange is one JSON line. Lines are appended to the file as a new
+    gzip member per batch, so the file stays readable with gzip.open even if
+    Home Assistant stops in the middle of a batch.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize recorder."""
+        self.path = path
+        self.pseudonyms = DevicePseudonyms()
+        self._lines: list[str] = []
+
+    def record(
+        self,
+        method: str,
+        path: str,
+        params: dict | None,
+        request_body: str | bytes | None,
+        status: int | str,
+        headers: Any,
+        body: bytes | None,
+        latency: float,
+    ) -> None:
+        """Record an exchange, headers are the response headers."""
+        path, request, response = self.pseudonyms.apply(
+            path, _decode(request_body), _decode(body)
+        )
+        self._lines.append(
+            json.dumps(
+                {
+                    "time": time(),
+                    "method": method.lower(),
+                    "path": path,
+                    "params": params or {},
+                    "request": redact(request),
+                    "status": status,
+                    "headers": {
+                        name: headers[name]
+                        for name in RECORDED_HEADERS
+                        if headers is not None and name in headers
+                    },
+                    "body": redact(response),
+                    "latency": latency,
+                }
+            )
+        )
+
+    def pop_lines(self) -> list[str]:
+        """Return the recorded lines and clear them."""
+        lines, self._lines = self._lines, []
+        return lines
+
+    def write(self, lines: list[str]) -> None:
+        """Append lines to the recording (blocking)."""
+        if not lines:
+            return
+        with gzip.open(self.path, "at", encoding="utf-8") as file:
+            file.writelines(f"{line}\n" for line in lines)
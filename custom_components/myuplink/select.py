@@ -60,21 +60,21 @@ async def async_setup_entry(
 class MyUplinkParameterSelectEntity(MyUplinkParameterEntity, SelectEntity):
     """Representation of a myUplink paramater select sensor."""
 
-    def _update_from_parameter(self, parameter: Parameter) -> None:
-        """Update attrs from parameter."""
-        super()._update_from_parameter(parameter)
+    def _update_config_from_parameter(self, parameter: Parameter) -> None:
+        """Update attrs from parameter metadata."""
+        super()._update_config_from_parameter(parameter)
         self._attr_translation_key = str(self._parameter.id)
-        self._attr_options = []
-        for enum in parameter.enum_values:
-            self._attr_options.append(enum["text"])
-        self._attr_current_option = parameter.string_value
+        self._attr_options = list(parameter.enum_map.options)
+
+    def _update_value_from_parameter(self, parameter: Parameter) -> None:
+        """Update the state from the parameter value."""
+        self._attr_current_option = parameter.enum_text
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected parameter option."""
-        options = {}
-        for enum in self._parameter.enum_values:
-            options[enum["text"]] = enum["value"]
-        await self._parameter.update_parameter(options[option])
+        await self._parameter.update_parameter(
+            self._parameter.enum_map.text_to_value[option]
+        )
         await self.async_update()
 
 
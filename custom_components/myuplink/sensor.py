@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -20,21 +26,117 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
 
 from .api import Device, Parameter, System, Zone
 from .const import CONF_FETCH_NOTIFICATIONS, DOMAIN, CustomUnits
-from .entity import MyUplinkDeviceEntity, MyUplinkParameterEntity, MyUplinkZoneEntity
+from .coordinator import MyUplinkDataUpdateCoordinator
+from .entity import (
+    MyUplinkApiEntity,
+    MyUplinkDeviceEntity,
+    MyUplinkParameterEntity,
+    MyUplinkZoneEntity,
+)
 
 PARALLEL_UPDATES = 0
 
 
+@dataclass(frozen=True, kw_only=True)
+class MyUplinkApiSensorEntityDescription(SensorEntityDescription):
+    """Describes a myUplink API sensor entity."""
+
+    value_fn: Callable[[MyUplinkDataUpdateCoordinator], StateType | datetime]
+
+
+API_SENSORS: tuple[MyUplinkApiSensorEntityDescription, ...] = (
+    MyUplinkApiSensorEntityDescription(
+        key="rate_limit_remaining",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.api.auth.rate_limit_remaining,
+    ),
+    MyUplinkApiSensorEntityDescription(
+        key="rate_limit_reset",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda coordinator: (
+            coordinator.api.auth.rate_limit_reset_at.astimezone()
+            if coordinator.api.auth.rate_limit_reset_at
+            else None
+        ),
+    ),
+    MyUplinkApiSensorEntityDescription(
+        key="requests_per_cycle",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: (
+            coordinator.last_cycle.requests if coordinator.last_cycle else None
+        ),
+    ),
+    MyUplinkApiSensorEntityDescription(
+        key="cycle_duration",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: (
+            coordinator.last_cycle.duration if coordinator.last_cycle else None
+        ),
+    ),
+    MyUplinkApiSensorEntityDescription(
+        key="throttle_wait",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: (
+            coordinator.last_cycle.throttle_wait if coordinator.last_cycle else None
+        ),
+    ),
+    MyUplinkApiSensorEntityDescription(
+        key="rate_limited_requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.api.auth.rate_limited_count,
+    ),
+    MyUplinkApiSensorEntityDescription(
+        key="failed_requests",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: (
+            coordinator.last_cycle.failed_requests if coordinator.last_cycle else None
+        ),
+    ),
+    MyUplinkApiSensorEntityDescription(
+        key="write_latency",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: coordinator.api.write_latency.last,
+    ),
+    MyUplinkApiSensorEntityDescription(
+        key="suppressed_state_writes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.api.state_filter.suppressed,
+    ),
+    MyUplinkApiSensorEntityDescription(
+        key="write_confirmation_latency",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=1,
+        value_fn=lambda coordinator: (
+            coordinator.api.pending_writes.last_confirmation_seconds
+        ),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up the platform entities."""
 
     coordinator = entry.runtime_data
-    entities: list[SensorEntity] = []
+    entities: list[SensorEntity] = [
+        MyUplinkApiSensorEntity(coordinator, description) for description in API_SENSORS
+    ]
 
     for system in coordinator.data:
         system: System
@@ -82,17 +184,18 @@ async def async_setup_entry(
 class MyUplinkParameterSensorEntity(MyUplinkParameterEntity, SensorEntity):
     """Representation of a myUplink parameter sensor entity."""
 
-    def _update_from_parameter(self, parameter: Parameter) -> None:
-        """Update attrs from parameter."""
-        super()._update_from_parameter(parameter)
+    _filter_state_writes = True
+    _is_enum = False
+
+    def _update_config_from_parameter(self, parameter: Parameter) -> None:
+        """Update attrs from parameter metadata."""
+        super()._update_config_from_parameter(parameter)
 
-        if not self._parameter.unit and len(parameter.enum_values):
+        self._is_enum = not self._parameter.unit and len(parameter.enum_values) > 0
+        if self._is_enum:
             self._attr_device_class = SensorDeviceClass.ENUM
             self._attr_translation_key = str(self._parameter.id)
-            self._attr_options = []
-            for option in parameter.enum_values:
-                self._attr_options.append(option["text"])
-            self._attr_native_value = self._parameter.string_value
+            self._attr_options = list(parameter.enum_map.options)
 
         else:
             self._attr_native_unit_of_measurement = self._parameter.unit
@@ -131,7 +234,37 @@ class MyUplinkParameterSensorEntity(MyUplinkParameterEntity, SensorEntity):
             elif self._parameter.unit in (PERCENTAGE, CustomUnits.VOLUME_LM):
                 self._attr_icon = "mdi:speedometer"
 
-            self._attr_native_value = self._parameter.value
+    def _update_value_from_parameter(self, parameter: Parameter) -> None:
+        """Update the state from the parameter value."""
+        if self._is_enum:
+            self._attr_native_value = parameter.enum_text
+        else:
+            self._attr_native_value = parameter.value
+
+    @property
+    def _filtered_value(self) -> Any:
+        """Return the displayed value, the option text of enum parameters."""
+        return self._attr_native_value
+
+
+class MyUplinkApiSensorEntity(MyUplinkApiEntity, SensorEntity):
+    """Representation of a myUplink API sensor entity."""
+
+    entity_description: MyUplinkApiSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: MyUplinkDataUpdateCoordinator,
+        description: MyUplinkApiSensorEntityDescription,
+    ) -> None:
+        """Initialize a myUplink API sensor entity."""
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator)
 
 
 class MyUplinkNotificationsSensorEntity(MyUplinkDeviceEntity, SensorEntity):
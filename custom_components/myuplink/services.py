@@ -2,27 +2,50 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
+import cProfile
 import logging
+import pstats
+from time import monotonic, perf_counter, time
+from typing import Any
 
 from aiohttp import ClientResponseError
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import ATTR_DEVICE_ID
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import device_registry as dr, selector
-from homeassistant.helpers.service import async_extract_config_entry_ids
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers import config_validation as cv, selector
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+try:
+    from pyinstrument import Profiler as SamplingProfiler
+except ImportError:
+    SamplingProfiler = None
 
-from .api import Device
+from .api import Device, Parameter
 from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_CYCLES,
+    ATTR_MAX_AGE,
     ATTR_PARAMETER_ID,
+    ATTR_PARAMETER_IDS,
     ATTR_PROPERTY_NAME,
     ATTR_VALUE,
+    ATTR_VALUES,
     ATTR_ZONE_ID,
+    DEFAULT_PARAMETER_MAX_AGE,
     DOMAIN,
+    SIGNAL_PARAMETER_UPDATED,
 )
+from .coordinator import MyUplinkDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +61,17 @@ SERVICE_SCHEMA_SET_DEVICE_PARAMETER_VALUE = vol.Schema(
     }
 )
 
+SERVICE_SET_DEVICE_PARAMETER_VALUES = "set_device_parameter_values"
+
+SERVICE_SCHEMA_SET_DEVICE_PARAMETER_VALUES = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_VALUES): vol.All(
+            {cv.string: vol.Any(int, float, cv.string)}, vol.Length(min=1)
+        ),
+    }
+)
+
 SERVICE_SET_DEVICE_ZONE_PROPERTY_VALUE = "set_device_zone_property_value"
 
 SERVICE_SCHEMA_SET_DEVICE_ZONE_PROPERTY_VALUE = vol.Schema(
@@ -49,6 +83,24 @@ SERVICE_SCHEMA_SET_DEVICE_ZONE_PROPERTY_VALUE = vol.Schema(
     }
 )
 
+SERVICE_GET_DEVICE_PARAMETER_VALUES = "get_device_parameter_values"
+
+SERVICE_SCHEMA_GET_DEVICE_PARAMETER_VALUES = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ATTR_PARAMETER_IDS): vol.All(
+            cv.ensure_list, [cv.string], vol.Length(min=1)
+        ),
+        vol.Optional(ATTR_MAX_AGE, default=DEFAULT_PARAMETER_MAX_AGE): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+
+SERVICE_GET_REQUEST_STATISTICS = "get_request_statistics"
+
+SERVICE_SCHEMA_GET_REQUEST_STATISTICS = vol.Schema({})
+
 SERVICE_LIST: list[tuple[str, vol.Schema | None]] = [
     (SERVICE_SET_DEVICE_PARAMETER_VALUE, SERVICE_SCHEMA_SET_DEVICE_PARAMETER_VALUE),
     (
@@ -57,20 +109,49 @@ SERVICE_LIST: list[tuple[str, vol.Schema | None]] = [
     ),
 ]
 
+SERVICE_PROFILE = "profile"
+
+SERVICE_SCHEMA_PROFILE = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): selector.ConfigEntrySelector(
+            selector.ConfigEntrySelectorConfig(integration=DOMAIN)
+        ),
+        vol.Optional(ATTR_CYCLES, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=10)
+        ),
+    }
+)
+
+SERVICE_OPTIONAL_RESPONSE_LIST: list[tuple[str, vol.Schema | None]] = [
+    (SERVICE_SET_DEVICE_PARAMETER_VALUES, SERVICE_SCHEMA_SET_DEVICE_PARAMETER_VALUES),
+]
+
+SERVICE_RESPONSE_LIST: list[tuple[str, vol.Schema | None]] = [
+    (SERVICE_GET_DEVICE_PARAMETER_VALUES, SERVICE_SCHEMA_GET_DEVICE_PARAMETER_VALUES),
+    (SERVICE_GET_REQUEST_STATISTICS, SERVICE_SCHEMA_GET_REQUEST_STATISTICS),
+    (SERVICE_PROFILE, SERVICE_SCHEMA_PROFILE),
+]
+
+# Number of functions returned in the profile summary
+PROFILE_TOP_FUNCTIONS = 25
+
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for myUplink integration."""
 
-    for service, _ in SERVICE_LIST:
+    for service, _ in [
+        *SERVICE_LIST,
+        *SERVICE_OPTIONAL_RESPONSE_LIST,
+        *SERVICE_RESPONSE_LIST,
+    ]:
         if hass.services.has_service(DOMAIN, service):
             return
 
     async def async_call_myuplink_service(service_call: ServiceCall) -> None:
         """Call myUpLink service."""
 
-        if not (
-            device := await _async_get_selected_myuplink_device(hass, service_call)
-        ):
+        requested = perf_counter()
+        if not (device := _async_get_selected_myuplink_device(hass, service_call)):
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="device_not_found",
@@ -88,6 +169,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                     device.id,
                     parameter_id,
                     value,
+                    requested,
                 )
             except ClientResponseError as ex:
                 raise HomeAssistantError(
@@ -103,6 +185,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                     zone_id,
                     property_name,
                     value,
+                    requested,
                 )
             except ClientResponseError as ex:
                 raise HomeAssistantError(
@@ -110,36 +193,311 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                     f" Code: {ex.status}  Message: {ex.message}"
                 ) from ex
 
+    async def async_call_myuplink_values_service(
+        service_call: ServiceCall,
+    ) -> ServiceResponse:
+        """Set parameter values of devices with one request per device."""
+
+        requested = perf_counter()
+        _LOGGER.debug("Executing service %s", service_call.service)
+
+        writes: list[tuple[str, Device, dict[str, Any]]] = []
+        for device_id in service_call.data[ATTR_DEVICE_ID]:
+            if not (device := _async_get_myuplink_device(hass, device_id)):
+                raise HomeAssistantError(
+                    translation_domain=DOMAIN,
+                    translation_key="device_not_found",
+                    translation_placeholders={"service": service_call.service},
+                )
+            # Validate every device before writing to any of them.
+            writes.append(
+                (
+                    device_id,
+                    device,
+                    _validate_parameter_values(device, service_call.data[ATTR_VALUES]),
+                )
+            )
+
+        results: dict[str, Any] = {}
+        failed: list[str] = []
+        coordinators = set()
+        for device_id, device, values in writes:
+            try:
+                results[device_id] = await device.system.api.patch_parameters(
+                    device.id, values, requested
+                )
+            except ClientResponseError as ex:
+                failed.append(f"{device.id} (Code: {ex.status}  Message: {ex.message})")
+                results[device_id] = {
+                    parameter_id: {"value": value, "status": "error"}
+                    for parameter_id, value in values.items()
+                }
+            else:
+                coordinators.add(device.system.api.entry.runtime_data)
+
+        for coordinator in coordinators:
+            await coordinator.async_request_refresh()
+
+        # The response tells which parameters were written, so partial
+        # failures are only raised if no response was requested.
+        if failed and (len(failed) == len(writes) or not service_call.return_response):
+            raise HomeAssistantError(
+                "The myUplink API returned an error trying to set the parameters"
+                f" of devices {', '.join(failed)}"
+            )
+        if failed:
+            _LOGGER.warning(
+                "The myUplink API returned an error trying to set the parameters"
+                " of devices %s",
+                ", ".join(failed),
+            )
+
+        return results if service_call.return_response else None
+
+    async def async_call_myuplink_response_service(
+        service_call: ServiceCall,
+    ) -> ServiceResponse:
+        """Call myUplink service returning response data."""
+
+        _LOGGER.debug("Executing service %s", service_call.service)
+
+        if service_call.service == SERVICE_GET_DEVICE_PARAMETER_VALUES:
+            if not (device := _async_get_selected_myuplink_device(hass, service_call)):
+                raise HomeAssistantError(
+                    translation_domain=DOMAIN,
+                    translation_key="device_not_found",
+                    translation_placeholders={"service": service_call.service},
+                )
+
+            requested = monotonic()
+            try:
+                parameters = await device.system.api.get_parameter_values(
+                    device,
+                    service_call.data[ATTR_PARAMETER_IDS],
+                    service_call.data[ATTR_MAX_AGE],
+                )
+            except ClientResponseError as ex:
+                raise HomeAssistantError(
+                    f"The myUplink API returned an error trying to read parameters of device {device.id}"
+                    f" Code: {ex.status}  Message: {ex.message}"
+                ) from ex
+
+            # Only the entities of parameters read just now are updated.
+            for parameter in parameters:
+                if parameter.fetched_at >= requested:
+                    async_dispatcher_send(
+                        hass,
+                        SIGNAL_PARAMETER_UPDATED.format(device.id, parameter.id),
+                        parameter,
+                    )
+
+            return {
+                str(parameter.id): {
+                    "name": parameter.name,
+                    "value": parameter.value,
+                    "string_value": parameter.string_value,
+                    "unit": parameter.unit,
+                    "timestamp": parameter.timestamp,
+                }
+                for parameter in parameters
+            }
+
+        coordinators = _async_get_loaded_coordinators(hass)
+
+        if service_call.service == SERVICE_GET_REQUEST_STATISTICS:
+            return {
+                entry_id: coordinator.api.auth.request_stats.as_dict()
+                for entry_id, coordinator in coordinators.items()
+            }
+
+        if service_call.service == SERVICE_PROFILE:
+            if entry_id := service_call.data.get(ATTR_CONFIG_ENTRY_ID):
+                if entry_id not in coordinators:
+                    raise HomeAssistantError(
+                        f"The myUplink config entry {entry_id} is not loaded"
+                    )
+                coordinators = {entry_id: coordinators[entry_id]}
+
+            # The sampling profiler only records the refresh cycles, cProfile
+            # traces every task running on the event loop meanwhile.
+            if SamplingProfiler is not None:
+                profiler = SamplingProfiler(async_mode="enabled")
+                start, stop = profiler.start, profiler.stop
+            else:
+                profiler = cProfile.Profile()
+                start, stop = profiler.enable, profiler.disable
+            try:
+                for coordinator in coordinators.values():
+                    await coordinator.async_profile_refresh(
+                        start, stop, service_call.data[ATTR_CYCLES]
+                    )
+            except (RuntimeError, ValueError) as ex:
+                raise HomeAssistantError(f"Unable to start the profiler: {ex}") from ex
+
+            if SamplingProfiler is not None:
+                return await hass.async_add_executor_job(
+                    _write_sampling_profile,
+                    profiler,
+                    hass.config.path(f"myuplink_profile_{int(time())}.html"),
+                )
+            return await hass.async_add_executor_job(
+                _write_profile,
+                profiler,
+                hass.config.path(f"myuplink_profile_{int(time())}.cprof"),
+            )
+
+        return None
+
     for service, schema in SERVICE_LIST:
         hass.services.async_register(
             DOMAIN, service, async_call_myuplink_service, schema
         )
 
+    for service, schema in SERVICE_OPTIONAL_RESPONSE_LIST:
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            async_call_myuplink_values_service,
+            schema,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    for service, schema in SERVICE_RESPONSE_LIST:
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            async_call_myuplink_response_service,
+            schema,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+
+def _write_profile(profiler: cProfile.Profile, path: str) -> dict[str, Any]:
+    """Write the profile to a file and return a summary of the top functions."""
+
+    profiler.dump_stats(path)
+
+    stats = pstats.Stats(profiler)
+    # Entries are (primitive calls, calls, total time, cumulative time, callers)
+    functions = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[
+        :PROFILE_TOP_FUNCTIONS
+    ]
+
+    return {
+        "file": path,
+        "profiler": "cProfile",
+        "total_time": stats.total_tt,
+        "functions": [
+            {
+                "function": f"{filename}:{line}({name})",
+                "calls": entry[1],
+                "total_time": entry[2],
+                "cumulative_time": entry[3],
+            }
+            for (filename, line, name), entry in functions
+        ],
+    }
 
-async def _async_get_selected_myuplink_device(
+
+def _write_sampling_profile(profiler: Any, path: str) -> dict[str, Any]:
+    """Write the sampled profile as HTML and return the top functions.
+
+    Functions are ranked by the time sampled in them, including the time
+    spent awaiting.
+    """
+
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(profiler.output_html())
+
+    session = profiler.last_session
+    self_times: dict[str, float] = defaultdict(float)
+    frames = [session.root_frame()] if session is not None else []
+    while frames:
+        if (frame := frames.pop()) is None:
+            continue
+        frames.extend(frame.children)
+        if not frame.is_synthetic:
+            self_times[f"{frame.file_path}:{frame.line_no}({frame.function})"] += (
+                frame.total_self_time
+            )
+    functions = sorted(self_times.items(), key=lambda item: item[1], reverse=True)[
+        :PROFILE_TOP_FUNCTIONS
+    ]
+
+    return {
+        "file": path,
+        "profiler": "pyinstrument",
+        "total_time": session.duration if session is not None else 0.0,
+        "samples": session.sample_count if session is not None else 0,
+        "functions": [
+            {"function": function, "self_time": self_time}
+            for function, self_time in functions
+        ],
+    }
+
+
+def _async_get_loaded_coordinators(
+    hass: HomeAssistant,
+) -> dict[str, MyUplinkDataUpdateCoordinator]:
+    """Get the coordinators of all loaded myUplink config entries."""
+
+    return {
+        config_entry.entry_id: config_entry.runtime_data
+        for config_entry in hass.config_entries.async_entries(DOMAIN)
+        if config_entry.state == ConfigEntryState.LOADED
+    }
+
+
+def _get_parameter(device: Device, parameter_id: str) -> Parameter | None:
+    """Return a polled parameter of a device by id."""
+
+    try:
+        return device.parameter_index.get(int(parameter_id))
+    except ValueError:
+        return None
+
+
+def _validate_parameter_values(
+    device: Device, values: dict[str, Any]
+) -> dict[str, Any]:
+    """Return the values as written to the API, raise if any is invalid."""
+
+    validated = {}
+    errors = []
+    for parameter_id, value in values.items():
+        if (parameter := _get_parameter(device, parameter_id)) is None:
+            errors.append(f"unknown parameter {parameter_id}")
+            continue
+        try:
+            validated[parameter_id] = parameter.validate_value(value)
+        except ValueError as ex:
+            errors.append(str(ex))
+
+    if errors:
+        raise HomeAssistantError(
+            f"Invalid parameter values for device {device.id}: {', '.join(errors)}"
+        )
+
+    return validated
+
+
+@callback
+def _async_get_selected_myuplink_device(
     hass: HomeAssistant, service_call: ServiceCall
 ) -> Device | None:
     """Get myUplink device for service call."""
 
-    device_id = service_call.data.get(ATTR_DEVICE_ID)
-    device_registry = dr.async_get(hass)
-
-    for entry_id in await async_extract_config_entry_ids(service_call):
-        config_entry = hass.config_entries.async_get_entry(entry_id)
-        if (
-            config_entry
-            and config_entry.domain == DOMAIN
-            and config_entry.state == ConfigEntryState.LOADED
-        ):
-            coordinator: DataUpdateCoordinator = config_entry.runtime_data
-            for myuplink_system in coordinator.data:
-                for myuplink_device in myuplink_system.devices:
-                    hass_device = device_registry.async_get_device(
-                        identifiers={(DOMAIN, myuplink_device.id)}
-                    )
-                    if hass_device is not None and hass_device.id == device_id:
-                        _LOGGER.debug("Found device %s", myuplink_device.id)
-                        return myuplink_device
+    return _async_get_myuplink_device(hass, service_call.data[ATTR_DEVICE_ID])
+
+
+@callback
+def _async_get_myuplink_device(hass: HomeAssistant, device_id: str) -> Device | None:
+    """Get myUplink device by Home Assistant device id."""
+
+    for coordinator in _async_get_loaded_coordinators(hass).values():
+        if (device := coordinator.get_device(device_id)) is not None:
+            _LOGGER.debug("Found device %s", device.id)
+            return device
 
     return None
 
@@ -152,5 +510,9 @@ async def async_unload_services(hass: HomeAssistant) -> None:
 
     hass.data[MYUPLINK_SERVICES] = False
 
-    for service, _ in SERVICE_LIST:
+    for service, _ in [
+        *SERVICE_LIST,
+        *SERVICE_OPTIONAL_RESPONSE_LIST,
+        *SERVICE_RESPONSE_LIST,
+    ]:
         hass.services.async_remove(DOMAIN, service)
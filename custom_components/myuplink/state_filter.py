@@ -0,0 +1,112 @@
+"""Deadband and minimum interval filtering of parameter state writes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import logging
+from time import monotonic
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Deadband:
+    """Change of a value that is too small to be written."""
+
+    width: float
+    relative: bool = False
+
+    @classmethod
+    def parse(cls, value: Any) -> Deadband:
+        """Return the deadband of an absolute number or a percentage like "5%"."""
+        if isinstance(value, str) and value.strip().endswith("%"):
+            return cls(float(value.strip()[:-1]) / 100, relative=True)
+        return cls(float(value))
+
+    def exceeded(self, written: float, value: float) -> bool:
+        """Return if value left the deadband around the last written value."""
+        width = abs(written) * self.width if self.relative else self.width
+        return abs(value - written) > width
+
+
+class StateWriteFilter:
+    """Decide if a parameter entity has to write its state.
+
+    Values are compared with the last written value instead of the previous
+    one, so a slow drift is written once it adds up to the deadband. The
+    counters show how many state writes, and recorder rows, were saved.
+    """
+
+    def __init__(self, deadbands: dict[str, Deadband], min_interval: float) -> None:
+        """Initialize filter."""
+        self.deadbands = deadbands
+        self.min_interval = min_interval
+        self.written = 0
+        self.unchanged = 0
+        self.suppressed_deadband = 0
+        self.suppressed_interval = 0
+
+    @classmethod
+    def from_options(cls, deadbands: str, min_interval: float) -> StateWriteFilter:
+        """Return a filter for the JSON deadbands option.
+
+        Keys are parameter ids or device classes, values absolute widths or
+        percentages of the last written value.
+        """
+        try:
+            parsed = {
+                str(key): Deadband.parse(value)
+                for key, value in json.loads(deadbands).items()
+            }
+        except (AttributeError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring invalid state deadbands %s: %s", deadbands, err)
+            parsed = {}
+        return cls(parsed, min_interval)
+
+    @property
+    def enabled(self) -> bool:
+        """Return if any state write can be suppressed."""
+        return bool(self.deadbands) or self.min_interval > 0
+
+    @property
+    def suppressed(self) -> int:
+        """Return the number of suppressed state writes."""
+        return self.suppressed_deadband + self.suppressed_interval
+
+    def deadband(self, parameter_id: int, device_class: str | None) -> Deadband | None:
+        """Return the deadband of a parameter, by id or else by device class."""
+        if (deadband := self.deadbands.get(str(parameter_id))) is not None:
+            return deadband
+        if device_class is not None:
+            return self.deadbands.get(device_class)
+        return None
+
+    def should_write(
+        self,
+        deadband: Deadband | None,
+        written_value: Any,
+        written_at: float | None,
+        value: Any,
+    ) -> bool:
+        """Return if a new value has to be written and count the decision."""
+        if value == written_value:
+            self.unchanged += 1
+            return False
+
+        if written_at is not None and written_value is not None and value is not None:
+            if monotonic() - written_at < self.min_interval:
+                self.suppressed_interval += 1
+                return False
+            if (
+                deadband is not None
+                and isinstance(value, int | float)
+                and isinstance(written_value, int | float)
+                and not deadband.exceeded(written_value, value)
+            ):
+                self.suppressed_deadband += 1
+                return False
+
+        self.written += 1
+        return True
@@ -40,9 +40,8 @@ async def async_setup_entry(
 class MyUplinkParameterSwitchEntityEntity(MyUplinkParameterEntity, SwitchEntity):
     """Representation of a myUplink paramater binary sensor."""
 
-    def _update_from_parameter(self, parameter: Parameter) -> None:
-        """Update attrs from parameter."""
-        super()._update_from_parameter(parameter)
+    def _update_value_from_parameter(self, parameter: Parameter) -> None:
+        """Update the state from the parameter value."""
         self._attr_is_on = bool(int(self._parameter.value))
 
     async def async_turn_on(self, **kwargs):
@@ -0,0 +1,128 @@
+"""Trace spans of myUplink refresh cycles written as JSON lines."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import json
+import logging
+from logging.handlers import RotatingFileHandler
+import secrets
+from time import time
+from typing import Any
+
+_CURRENT_SPAN: ContextVar[Span | None] = ContextVar("myuplink_span", default=None)
+
+
+@dataclass(slots=True)
+class Span:
+    """A timed operation within a refresh cycle."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start: float
+    end: float | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the span as dictionary."""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "end": self.end,
+            "duration": None if self.end is None else self.end - self.start,
+            **self.attributes,
+        }
+
+
+class Tracer:
+    """Collect spans and write them to a rotating JSON lines file.
+
+    Without a path the tracer is disabled and spans cost next to nothing.
+    Child spans find their parent through a context variable, so tasks
+    created within a span are attached to it as well.
+    """
+
+    MAX_BYTES = 10 * 1024 * 1024
+    BACKUP_COUNT = 3
+
+    def __init__(self, path: str | None = None) -> None:
+        """Initialize tracer."""
+        self.enabled = path is not None
+        self._spans: list[Span] = []
+        self._handler: RotatingFileHandler | None = None
+        if path is not None:
+            self._handler = RotatingFileHandler(
+                path,
+                maxBytes=self.MAX_BYTES,
+                backupCount=self.BACKUP_COUNT,
+                encoding="utf-8",
+                delay=True,
+            )
+            self._handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def _new_span(
+        self, name: str, parent: Span | None, start: float, attributes: dict
+    ) -> Span:
+        """Return a new span below parent."""
+        span_id = secrets.token_hex(8)
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent else span_id,
+            span_id=span_id,
+            parent_id=parent.span_id if parent else None,
+            start=start,
+            attributes=attributes,
+        )
+
+    @contextmanager
+    def span(
+        self, name: str, parent: Span | None = None, **attributes: Any
+    ) -> Iterator[Span | None]:
+        """Trace the enclosed block as span of the current or given parent."""
+        if not self.enabled:
+            yield None
+            return
+
+        span = self._new_span(name, parent or _CURRENT_SPAN.get(), time(), attributes)
+        token = _CURRENT_SPAN.set(span)
+        try:
+            yield span
+        finally:
+            span.end = time()
+            _CURRENT_SPAN.reset(token)
+            self._spans.append(span)
+
+    def record(self, name: str, start: float, end: float, **attributes: Any) -> None:
+        """Record a finished span of the current span."""
+        if not self.enabled:
+            return
+
+        span = self._new_span(name, _CURRENT_SPAN.get(), start, attributes)
+        span.end = end
+        self._spans.append(span)
+
+    def pop_lines(self) -> list[str]:
+        """Return the collected spans as JSON lines and clear them."""
+        spans, self._spans = self._spans, []
+        return [json.dumps(span.as_dict()) for span in spans]
+
+    def write(self, lines: list[str]) -> None:
+        """Write JSON lines to the trace file (blocking)."""
+        if self._handler is None:
+            return
+        for line in lines:
+            self._handler.emit(logging.makeLogRecord({"msg": line}))
+        self._handler.flush()
+
+    def close(self) -> None:
+        """Close the trace file (blocking)."""
+        if self._handler is not None:
+            self._handler.close()
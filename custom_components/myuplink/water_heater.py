@@ -12,12 +12,18 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .api import Device, Parameter, System
-from .const import WATER_HEATERS
+from .api import Device, System
 from .entity import MyUplinkDeviceEntity
 
 PARALLEL_UPDATES = 0
 
+# Parameter ids the entity is built from, see WATER_HEATER_PARAMETERS
+PARAMETER_OPERATION = 406
+PARAMETER_OPERATION_MODE = 500
+PARAMETER_START_DIFFERENCE = 516
+PARAMETER_TARGET_TEMPERATURE = 527
+PARAMETER_CURRENT_TEMPERATURE = 528
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -31,7 +37,7 @@ async def async_setup_entry(
         system: System
         for device in system.devices:
             device: Device
-            if device.name[:7] in WATER_HEATERS:
+            if device.is_water_heater:
                 entities.append(MyUplinkWaterHeaterEntity(coordinator, device))
 
     async_add_entities(entities)
@@ -40,55 +46,67 @@ async def async_setup_entry(
 class MyUplinkWaterHeaterEntity(MyUplinkDeviceEntity, WaterHeaterEntity):
     """Representation of a myUplink paramater binary sensor."""
 
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+
     def __init__(self, coordinator: DataUpdateCoordinator, device: Device) -> None:
         super().__init__(coordinator, device)
         self._update_from_parameters()
 
     def _update_from_parameters(self) -> None:
-        """Update attrs from parameter."""
-        # super()._update_from_parameter(parameter)
-        parameter_map: dict[int, Parameter] = {}
-        for parameter in self._device.parameters:
-            parameter_map[parameter.id] = parameter
-        # for some reason the min_value is formated like this: "2000" = 20.00 Celcius
-        self._attr_min_temp = (
-            parameter_map[527].min_value * parameter_map[527].scale_value
-        )
-        self._attr_max_temp = (
-            parameter_map[527].max_value * parameter_map[527].scale_value
-        )
-        self._attr_current_temperature = parameter_map[528].value
-        self._attr_target_temperature = parameter_map[527].value
+        """Update attrs from parameters.
+
+        Missing parameters leave their attributes empty instead of failing
+        the update.
+        """
+        index = self._device.parameter_index
+        target = index.get(PARAMETER_TARGET_TEMPERATURE)
+        current = index.get(PARAMETER_CURRENT_TEMPERATURE)
+        start_difference = index.get(PARAMETER_START_DIFFERENCE)
+        operation = index.get(PARAMETER_OPERATION)
+        operation_mode = index.get(PARAMETER_OPERATION_MODE)
+
+        supported_features = WaterHeaterEntityFeature(0)
+        if target is not None:
+            # The limits are scaled like the value, "2000" = 20.00 Celsius
+            self._attr_min_temp = target.min_value * target.scale_value
+            self._attr_max_temp = target.max_value * target.scale_value
+            supported_features |= WaterHeaterEntityFeature.TARGET_TEMPERATURE
+        self._attr_target_temperature = target.value if target else None
         self._attr_target_temperature_high = self._attr_target_temperature
-        self._attr_target_temperature_low = (
-            self._attr_target_temperature - parameter_map[516].value
-        )
-        self._attr_temperature_unit = UnitOfTemperature.CELSIUS
-        operation_types = []
-        for enum in parameter_map[500].enum_values:
-            operation_types.append(enum["text"])
-        self._attr_current_operation = parameter_map[406].string_value
-        self._attr_operation_list = operation_types
-        self._attr_supported_features = (
-            WaterHeaterEntityFeature.TARGET_TEMPERATURE
-            | WaterHeaterEntityFeature.OPERATION_MODE
-        )
+        self._attr_target_temperature_low = None
+        if (
+            self._attr_target_temperature is not None
+            and start_difference is not None
+            and start_difference.value is not None
+        ):
+            self._attr_target_temperature_low = (
+                self._attr_target_temperature - start_difference.value
+            )
+        self._attr_current_temperature = current.value if current else None
+
+        self._attr_current_operation = operation.string_value if operation else None
+        self._attr_operation_list = None
+        if operation_mode is not None:
+            self._attr_operation_list = operation_mode.enum_map.options
+            supported_features |= WaterHeaterEntityFeature.OPERATION_MODE
+        self._attr_supported_features = supported_features
 
     async def async_set_temperature(self, temperature: float, entity_id: str) -> None:
         """Update the current value."""
-        for parameter in self._device.parameters:
-            if parameter.id == 527:
-                await parameter.update_parameter(temperature)
+        if (
+            parameter := self._device.parameter_index.get(PARAMETER_TARGET_TEMPERATURE)
+        ) is not None:
+            await parameter.update_parameter(temperature)
         await self.async_update()
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Update the current value."""
-        for parameter in self._device.parameters:
-            if parameter.id == 500:
-                operation_types = {}
-                for enum in parameter.enum_values:
-                    operation_types[enum["text"]] = enum["value"]
-                await parameter.update_parameter(operation_types[operation_mode])
+        if (
+            parameter := self._device.parameter_index.get(PARAMETER_OPERATION_MODE)
+        ) is not None:
+            await parameter.update_parameter(
+                parameter.enum_map.text_to_value[operation_mode]
+            )
         await self.async_update()
 
     @callback
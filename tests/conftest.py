@@ -0,0 +1,56 @@
+"""Fixtures for myUplink tests.
+
+The tests exercise the API client and its helpers directly, without a
+running Home Assistant instance. Coroutine tests run in their own event
+loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+
+import pytest
+
+from benchmarks.harness import BenchConfigEntry, create_api
+from custom_components.myuplink.api import MyUplink
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function) -> bool | None:
+    """Run coroutine test functions with asyncio.run."""
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    arguments = {
+        name: pyfuncitem.funcargs[name]
+        for name in inspect.signature(pyfuncitem.obj).parameters
+    }
+    asyncio.run(pyfuncitem.obj(**arguments))
+    return True
+
+
+class FakeClock:
+    """Monotonic clock advanced by the test."""
+
+    def __init__(self) -> None:
+        """Initialize clock."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the monotonic clock of the API and state filter modules."""
+    fake = FakeClock()
+    monkeypatch.setattr("custom_components.myuplink.api.monotonic", fake)
+    monkeypatch.setattr("custom_components.myuplink.state_filter.monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def api() -> MyUplink:
+    """Return an API client without a web session."""
+    return create_api(None, None, BenchConfigEntry())
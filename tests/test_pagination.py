@@ -0,0 +1,144 @@
+"""Tests for reading paginated resources."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+from typing import Any
+
+from aiohttp import web
+import pytest
+
+from benchmarks.fake_server import API_PREFIX, FakeApiServer, ServerConfig
+from benchmarks.harness import BenchConfigEntry, create_api
+from benchmarks.payloads import Account, AccountSize
+from custom_components.myuplink.api import ConnectionStats, MyUplink, create_websession
+
+PER_PAGE = MyUplink.ITEMS_PER_PAGE
+
+
+def serve_pages(api: MyUplink, pages: list[dict[str, Any]]) -> list[dict]:
+    """Answer GET requests of api with pages, the last page repeats.
+
+    Return the list the request parameters are appended to.
+    """
+    requests: list[dict] = []
+
+    async def get_json(path: str, headers=None, params=None, cache=True) -> Any:
+        requests.append(params)
+        return pages[min(len(requests), len(pages)) - 1]
+
+    api._get_json = get_json
+    return requests
+
+
+def systems(count: int) -> list[dict[str, str]]:
+    """Return count system payloads."""
+    return [{"systemId": str(index)} for index in range(count)]
+
+
+async def read(api: MyUplink) -> list[list[dict]]:
+    """Return the pages of the systems resource."""
+    return [page async for page in api.iter_pages("systems/me", "systems")]
+
+
+async def test_short_page_ends_pagination(api: MyUplink) -> None:
+    """A page with fewer items than requested is the last page."""
+    requests = serve_pages(
+        api,
+        [{"systems": systems(PER_PAGE)}, {"systems": systems(3)}, {"systems": []}],
+    )
+
+    pages = await read(api)
+
+    assert [len(page) for page in pages] == [PER_PAGE, 3]
+    assert requests == [
+        {"page": 1, "itemsPerPage": PER_PAGE},
+        {"page": 2, "itemsPerPage": PER_PAGE},
+    ]
+
+
+async def test_num_items_ends_pagination(api: MyUplink) -> None:
+    """A full page is the last page if it completes numItems."""
+    requests = serve_pages(api, [{"systems": systems(PER_PAGE), "numItems": PER_PAGE}])
+
+    pages = await read(api)
+
+    assert [len(page) for page in pages] == [PER_PAGE]
+    assert len(requests) == 1
+
+
+async def test_empty_resource(api: MyUplink) -> None:
+    """An empty resource yields no pages."""
+    serve_pages(api, [{"systems": [], "numItems": 0}])
+
+    assert await read(api) == []
+
+
+async def test_max_pages_bound(
+    api: MyUplink, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Reading stops after MAX_PAGES if the server ignores the page."""
+    monkeypatch.setattr(api, "MAX_PAGES", 5)
+    requests = serve_pages(api, [{"systems": systems(PER_PAGE)}])
+
+    with caplog.at_level(logging.WARNING):
+        pages = await read(api)
+
+    assert len(pages) == 5
+    assert len(requests) == 5
+    assert "Stopped reading systems/me after 5 pages" in caplog.text
+
+
+@asynccontextmanager
+async def serve_account(
+    account: Account,
+) -> AsyncIterator[tuple[FakeApiServer, MyUplink]]:
+    """Serve account with the fake API server and return a client for it."""
+    server = FakeApiServer(account, ServerConfig(rate_limit=1_000_000))
+    runner = web.AppRunner(server.create_app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    websession = create_websession(ConnectionStats())
+    try:
+        yield (
+            server,
+            create_api(
+                None,
+                websession,
+                BenchConfigEntry(),
+                f"http://{host}:{port}{API_PREFIX}",
+            ),
+        )
+    finally:
+        await websession.close()
+        await runner.cleanup()
+
+
+async def test_fake_server_pages() -> None:
+    """All systems of a large account are read page by page."""
+    account = Account(AccountSize(systems=1050, devices=1, points=5))
+    async with serve_account(account) as (server, api):
+        pages = await read(api)
+
+    assert [len(page) for page in pages] == [PER_PAGE] * 10 + [60]
+    assert [system["systemId"] for page in pages for system in page] == [
+        system["systemId"] for system in account.systems
+    ]
+    assert server.requests == 11
+
+
+async def test_fake_server_get_systems() -> None:
+    """get_systems returns every system of a large account with its devices."""
+    account = Account(AccountSize(systems=1050, devices=1, points=5))
+    async with serve_account(account) as (_, api):
+        result = await api.get_systems()
+
+    assert len(result) == len(account.systems)
+    assert {system.id for system in result} == {
+        system["systemId"] for system in account.systems
+    }
+    assert all(len(system.devices) == 1 for system in result)
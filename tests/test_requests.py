@@ -0,0 +1,234 @@
+"""Tests for sharing, ordering and debouncing API requests."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.myuplink.api import RequestSlot, SingleFlight, WriteDebouncer
+
+
+async def test_single_flight_shares_running_request() -> None:
+    """Concurrent calls with the same key share one request."""
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "result"
+
+    tasks = [asyncio.create_task(single_flight.run("key", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["result"] * 3
+    assert calls == 1
+    assert (single_flight.hits, single_flight.misses) == (2, 1)
+
+
+async def test_single_flight_reuses_result_within_ttl(clock) -> None:
+    """Finished results are reused for ttl seconds."""
+    single_flight = SingleFlight(ttl=5)
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await single_flight.run("key", fetch) == 1
+    clock.now += 4
+    assert await single_flight.run("key", fetch) == 1
+    clock.now += 2
+    assert await single_flight.run("key", fetch) == 2
+
+
+async def test_single_flight_keeps_request_for_remaining_callers() -> None:
+    """A cancelled caller does not cancel the request of the others."""
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        await release.wait()
+        return "result"
+
+    first = asyncio.create_task(single_flight.run("key", fetch))
+    second = asyncio.create_task(single_flight.run("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == "result"
+    assert first.cancelled()
+
+
+async def test_single_flight_cancels_abandoned_request() -> None:
+    """The request is cancelled once every caller was cancelled."""
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fetch() -> None:
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    tasks = [asyncio.create_task(single_flight.run("key", fetch)) for _ in range(2)]
+    await started.wait()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+async def test_single_flight_invalidate_starts_new_request() -> None:
+    """Callers after an invalidation do not share the detached request."""
+    single_flight = SingleFlight(ttl=60)
+    release = asyncio.Event()
+    results = iter(["stale", "fresh"])
+
+    async def fetch() -> str:
+        result = next(results)
+        if result == "stale":
+            await release.wait()
+        return result
+
+    stale = asyncio.create_task(single_flight.run("key", fetch))
+    await asyncio.sleep(0)
+    single_flight.invalidate(lambda key: key == "key")
+    fresh = await single_flight.run("key", fetch)
+    release.set()
+
+    assert (await stale, fresh) == ("stale", "fresh")
+    # The detached request is not cached.
+    assert await single_flight.run("key", fetch) == "fresh"
+
+
+async def test_request_slot_serves_writes_first() -> None:
+    """Queued writes get the slot before reads queued earlier."""
+    slot = RequestSlot()
+    order: list[str] = []
+
+    async def request(name: str, priority: bool) -> None:
+        async with slot.reserve(priority):
+            order.append(name)
+
+    await slot.acquire()
+    tasks = [
+        asyncio.create_task(request("read 1", False)),
+        asyncio.create_task(request("read 2", False)),
+        asyncio.create_task(request("write", True)),
+    ]
+    await asyncio.sleep(0)
+    assert (slot.queued_reads, slot.queued_writes) == (2, 1)
+
+    slot.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["write", "read 1", "read 2"]
+    assert not slot.locked()
+
+
+async def test_request_slot_skips_cancelled_waiter() -> None:
+    """A cancelled waiter leaves the queue without blocking the slot."""
+    slot = RequestSlot()
+    await slot.acquire()
+    cancelled = asyncio.create_task(slot.acquire(priority=True))
+    waiting = asyncio.create_task(slot.acquire())
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    await asyncio.gather(cancelled, return_exceptions=True)
+    slot.release()
+    await asyncio.wait_for(waiting, 1)
+
+    assert slot.locked()
+    slot.release()
+    assert not slot.locked()
+
+
+async def test_write_debouncer_collapses_writes() -> None:
+    """Rapid writes of a key send only the last value."""
+    debouncer = WriteDebouncer(0.01)
+    written: list[int] = []
+
+    def write(value: int):
+        async def send() -> int:
+            written.append(value)
+            return value
+
+        return send
+
+    results = await asyncio.gather(
+        *(debouncer.write("key", write(value)) for value in range(3))
+    )
+
+    assert written == [2]
+    assert results == [2, 2, 2]
+    assert debouncer.collapsed == 2
+
+
+async def test_write_debouncer_keeps_keys_apart() -> None:
+    """Writes of different keys are sent separately."""
+    debouncer = WriteDebouncer(0.01)
+    written: list[str] = []
+
+    def write(key: str):
+        async def send() -> None:
+            written.append(key)
+
+        return send
+
+    await asyncio.gather(
+        debouncer.write("a", write("a")), debouncer.write("b", write("b"))
+    )
+
+    assert sorted(written) == ["a", "b"]
+    assert debouncer.collapsed == 0
+
+
+async def test_write_debouncer_sends_write_of_cancelled_caller() -> None:
+    """A cancelled caller does not cancel the write for the other callers."""
+    debouncer = WriteDebouncer(0.01)
+    written: list[int] = []
+
+    def write(value: int):
+        async def send() -> int:
+            written.append(value)
+            return value
+
+        return send
+
+    first = asyncio.create_task(debouncer.write("key", write(1)))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(debouncer.write("key", write(2)))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == 2
+    assert written == [2]
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_write_debouncer_without_delay_writes_at_once() -> None:
+    """Without a quiet period every write is sent directly."""
+    debouncer = WriteDebouncer(0)
+    written: list[int] = []
+
+    async def send() -> None:
+        written.append(len(written))
+
+    await debouncer.write("key", send)
+    await debouncer.write("key", send)
+
+    assert written == [0, 1]
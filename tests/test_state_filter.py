@@ -0,0 +1,117 @@
+"""Tests for filtering parameter state writes."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.myuplink.state_filter import Deadband, StateWriteFilter
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (0.5, Deadband(0.5)),
+        ("2", Deadband(2.0)),
+        ("5%", Deadband(0.05, relative=True)),
+        (" 10 % ", Deadband(0.1, relative=True)),
+    ],
+)
+def test_parse_deadband(value: float | str, expected: Deadband) -> None:
+    """Deadbands are absolute numbers or percentages."""
+    assert Deadband.parse(value) == expected
+
+
+def test_absolute_deadband() -> None:
+    """Changes larger than the width leave an absolute deadband."""
+    deadband = Deadband(0.5)
+
+    assert not deadband.exceeded(20.0, 20.5)
+    assert not deadband.exceeded(20.0, 19.5)
+    assert deadband.exceeded(20.0, 20.6)
+
+
+def test_relative_deadband() -> None:
+    """The width of a relative deadband scales with the written value."""
+    deadband = Deadband(0.05, relative=True)
+
+    assert not deadband.exceeded(1000, 1040)
+    assert deadband.exceeded(1000, 1060)
+    assert deadband.exceeded(10, 10.6)
+
+
+def test_from_options() -> None:
+    """Deadbands are read from JSON, keyed by parameter id or device class."""
+    state_filter = StateWriteFilter.from_options(
+        '{"40004": 0.5, "temperature": 0.2, "power": "5%"}', 30
+    )
+
+    assert state_filter.enabled
+    assert state_filter.min_interval == 30
+    assert state_filter.deadband(40004, "temperature") == Deadband(0.5)
+    assert state_filter.deadband(40005, "temperature") == Deadband(0.2)
+    assert state_filter.deadband(40006, "power") == Deadband(0.05, relative=True)
+    assert state_filter.deadband(40007, None) is None
+
+
+@pytest.mark.parametrize("deadbands", ["not json", "[1, 2]", '{"40004": "wide"}'])
+def test_from_invalid_options(deadbands: str) -> None:
+    """Invalid deadbands are ignored."""
+    state_filter = StateWriteFilter.from_options(deadbands, 0)
+
+    assert state_filter.deadbands == {}
+    assert not state_filter.enabled
+
+
+def test_first_value_is_written(clock) -> None:
+    """Entities without a written value always write."""
+    state_filter = StateWriteFilter({}, 60)
+
+    assert state_filter.should_write(Deadband(1), None, None, 20.0)
+    assert state_filter.written == 1
+
+
+def test_unchanged_value_is_skipped(clock) -> None:
+    """Values equal to the written value are not written again."""
+    state_filter = StateWriteFilter({}, 0)
+
+    assert not state_filter.should_write(None, "Normal", clock.now, "Normal")
+    assert state_filter.unchanged == 1
+    assert state_filter.suppressed == 0
+
+
+def test_deadband_compares_with_written_value(clock) -> None:
+    """A slow drift is written once it adds up to the deadband."""
+    state_filter = StateWriteFilter({}, 0)
+    deadband = Deadband(0.5)
+    written_at = clock.now
+
+    assert not state_filter.should_write(deadband, 20.0, written_at, 20.3)
+    assert not state_filter.should_write(deadband, 20.0, written_at, 20.5)
+    assert state_filter.should_write(deadband, 20.0, written_at, 20.6)
+    assert (state_filter.suppressed_deadband, state_filter.written) == (2, 1)
+
+
+def test_deadband_ignores_text_values(clock) -> None:
+    """Changed option texts are written regardless of deadbands."""
+    state_filter = StateWriteFilter({}, 0)
+
+    assert state_filter.should_write(Deadband(10), "Normal", clock.now, "Luxury")
+
+
+def test_min_interval(clock) -> None:
+    """Changed values are skipped within the minimum interval."""
+    state_filter = StateWriteFilter({}, 60)
+    written_at = clock.now
+
+    clock.now += 59
+    assert not state_filter.should_write(None, 20.0, written_at, 25.0)
+    clock.now += 2
+    assert state_filter.should_write(None, 20.0, written_at, 25.0)
+    assert state_filter.suppressed_interval == 1
+
+
+def test_unavailable_value_is_written(clock) -> None:
+    """Values turning unknown are written at once."""
+    state_filter = StateWriteFilter({}, 60)
+
+    assert state_filter.should_write(Deadband(1), 20.0, clock.now, None)
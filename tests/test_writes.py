@@ -0,0 +1,168 @@
+"""Tests for validating written values and showing them until confirmed."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.myuplink.api import Parameter, PendingWrites
+
+
+def make_parameter(point: dict[str, Any], premium_manage: bool = True) -> Parameter:
+    """Return a parameter of a device of a system with or without premium."""
+    device = SimpleNamespace(
+        id="device-1",
+        system=SimpleNamespace(
+            premium_manage=premium_manage,
+            api=SimpleNamespace(
+                writable_without_subscription=False, writable_override={}
+            ),
+        ),
+    )
+    return Parameter(point, device)
+
+
+def make_point(parameter_id: int, value: float, **metadata: Any) -> dict[str, Any]:
+    """Return a points payload item."""
+    return {
+        "category": "Heat pump",
+        "parameterId": str(parameter_id),
+        "parameterName": f"Parameter {parameter_id}",
+        "parameterUnit": "",
+        "writable": True,
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "value": value,
+        "strVal": str(value),
+        "smartHomeCategories": [],
+        "minValue": None,
+        "maxValue": None,
+        "stepValue": 1,
+        "enumValues": [],
+        "scaleValue": "1",
+        "zoneId": None,
+        **metadata,
+    }
+
+
+TEMPERATURE = make_point(
+    47011, 20.0, minValue=100, maxValue=300, stepValue=5, scaleValue="0.1"
+)
+MODE = make_point(
+    47041,
+    1,
+    enumValues=[
+        {"value": str(index), "text": text, "icon": ""}
+        for index, text in enumerate(("Economy", "Normal", "Luxury"))
+    ],
+    strVal="Normal",
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(10, 10.0), ("21.5", 21.5), (30, 30.0), ("25", 25.0)],
+)
+def test_validate_number(value: Any, expected: float) -> None:
+    """Numbers within the scaled range and step are accepted."""
+    assert make_parameter(TEMPERATURE).validate_value(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "message"),
+    [
+        (9.5, "below the minimum"),
+        (30.5, "above the maximum"),
+        (21.2, "not a valid step"),
+        ("warm", "not a number"),
+        (None, "not a number"),
+    ],
+)
+def test_validate_invalid_number(value: Any, message: str) -> None:
+    """Numbers outside the range or step are rejected."""
+    with pytest.raises(ValueError, match=message):
+        make_parameter(TEMPERATURE).validate_value(value)
+
+
+@pytest.mark.parametrize(("value", "expected"), [(2, 2), ("1", 1), ("Luxury", 2)])
+def test_validate_option(value: Any, expected: int) -> None:
+    """Options are accepted by value or by text."""
+    assert make_parameter(MODE).validate_value(value) == expected
+
+
+def test_validate_unknown_option() -> None:
+    """Values that are no option are rejected."""
+    with pytest.raises(ValueError, match="not an option"):
+        make_parameter(MODE).validate_value("Boost")
+
+
+def test_validate_not_writable() -> None:
+    """Parameters that are not writable reject every value."""
+    with pytest.raises(ValueError, match="not writable"):
+        make_parameter(TEMPERATURE, premium_manage=False).validate_value(20)
+
+
+def test_pending_write_shown_until_confirmed(clock) -> None:
+    """A written value replaces the polled value until a poll returns it."""
+    pending = PendingWrites(ttl=300)
+    pending.add("device-1", "47011", "22.5")
+    assert pending.has_pending("device-1")
+
+    shown = pending.apply("device-1", TEMPERATURE)
+    assert shown["value"] == 22.5
+    assert TEMPERATURE["value"] == 20.0
+
+    clock.now += 12
+    confirmed = pending.apply("device-1", {**TEMPERATURE, "value": 22.5})
+    assert confirmed["value"] == 22.5
+    assert not pending.has_pending("device-1")
+    assert pending.confirmed == 1
+    assert pending.last_confirmation_seconds == 12
+
+
+def test_pending_write_confirmed_by_integer_poll(clock) -> None:
+    """String writes are confirmed by the polled number."""
+    pending = PendingWrites(ttl=300)
+    pending.add("device-1", "47041", "2")
+
+    assert pending.apply("device-1", {**MODE, "value": 2})["value"] == 2
+    assert pending.confirmed == 1
+
+
+def test_pending_write_sets_option_text(clock) -> None:
+    """Pending writes of enum parameters show the text of the option."""
+    pending = PendingWrites(ttl=300)
+    pending.add("device-1", "47041", "2")
+
+    shown = pending.apply("device-1", MODE)
+
+    assert (shown["value"], shown["strVal"]) == (2, "Luxury")
+
+
+def test_pending_write_expires(clock) -> None:
+    """Values not confirmed within the ttl show the polled value again."""
+    pending = PendingWrites(ttl=300)
+    pending.add("device-1", "47011", 22.5)
+
+    clock.now += 301
+    assert pending.apply("device-1", TEMPERATURE)["value"] == 20.0
+    assert pending.expired == 1
+    assert len(pending) == 0
+
+
+def test_pending_write_ignores_other_parameters(clock) -> None:
+    """Only the written parameter of the written device is replaced."""
+    pending = PendingWrites(ttl=300)
+    pending.add("device-1", "47011", 22.5)
+
+    assert pending.apply("device-2", TEMPERATURE) is TEMPERATURE
+    assert pending.apply("device-1", MODE) is MODE
+
+
+def test_pending_write_skips_values_that_are_no_number() -> None:
+    """Values the API does not poll as numbers are not shown."""
+    pending = PendingWrites(ttl=300)
+    pending.add("device-1", "47011", "warm")
+
+    assert not pending.has_pending("device-1")